@@ -0,0 +1,54 @@
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+class FakeConnection:
+    def is_connected(self):
+        return True
+
+class FakeDatabase:
+    """Stand-in for core.database.DatabasePool that answers the stats query.
+
+    Every query sleeps for latency seconds like a round trip to MySQL would,
+    then returns a fixed player distribution for each realm in the query.
+    """
+
+    def __init__(self, latency=0.005, online=500, gms=3, tickets=7):
+        self.latency = latency
+        self.online = online
+        self.gms = gms
+        self.tickets = tickets
+        self.queries = 0
+        self.last_query = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        time.sleep(self.latency)
+        yield FakeConnection()
+
+    def reset(self):
+        pass
+
+    def _rows(self, query):
+        # The stats query tags every realm's sub-select with its index
+        realms = sorted({int(index) for index in re.findall(r"SELECT (\d+), 'tickets'", query)})
+        rows = []
+        for index in realms:
+            rows.append((index, 'race', 1, self.online // 2))
+            rows.append((index, 'race', 2, self.online - self.online // 2))
+            rows.append((index, 'gms', 0, self.gms))
+            rows.append((index, 'tickets', 0, self.tickets))
+        return rows
+
+    def fetchall(self, query, params=None):
+        with self._lock:
+            self.queries += 1
+            self.last_query = time.monotonic()
+        time.sleep(self.latency)
+        return self._rows(query)
+
+    def fetchone(self, query, params=None):
+        rows = self.fetchall(query, params)
+        return rows[0] if rows else None
@@ -0,0 +1,107 @@
+import argparse
+import sys
+import threading
+import time
+
+# Stand-in worldserver for the benchmark suite.
+#
+# Writes numbered, timestamped lines at fixed rates to stdout, stderr and a
+# log file, answers "ping <t>" on stdin with "pong <t>", stops on
+# "server exit" and otherwise exits with --exit-code after --duration.
+# Like the real console it prints the "AC> " prompt, without a newline,
+# once at startup and after every command.
+#
+# Every generated line looks like "#o <seq> <time.time()> <padding>" where
+# o/e/l is stdout/stderr/log file, so the harness can measure latency.
+
+# Lines are written in batches this often (seconds)
+BATCH_INTERVAL = 0.01
+PROMPT = "AC> "
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fake worldserver for the benchmarks.")
+    parser.add_argument("--stdout-rate", type=float, default=1000, help="lines/s on stdout")
+    parser.add_argument("--stderr-rate", type=float, default=0, help="lines/s on stderr")
+    parser.add_argument("--log-rate", type=float, default=0, help="lines/s into --log-file")
+    parser.add_argument("--log-file", help="log file, truncated at start")
+    parser.add_argument("--line-size", type=int, default=120, help="approximate bytes per line")
+    parser.add_argument("--duration", type=float, default=5, help="seconds before exiting")
+    parser.add_argument("--exit-code", type=int, default=0, help="exit code after --duration")
+    return parser.parse_args()
+
+class Emitter:
+    def __init__(self, tag, stream, rate, line_size):
+        self.tag = tag
+        self.stream = stream
+        self.rate = rate
+        self.padding = "x" * max(0, line_size - 40)
+        self.count = 0
+
+    def emit_due(self, elapsed):
+        due = int(self.rate * elapsed) - self.count
+        if due <= 0:
+            return
+        now = time.time()
+        self.stream.write("".join(
+            f"#{self.tag} {self.count + i} {now:.6f} {self.padding}\n" for i in range(due)
+        ))
+        self.stream.flush()
+        self.count += due
+
+def read_console(stop, lock):
+    for line in sys.stdin:
+        command = line.strip()
+        if command == "server exit":
+            stop.set()
+            return
+        with lock:
+            if command.startswith("ping "):
+                sys.stdout.write(f"pong {command[5:]}\n")
+            else:
+                sys.stdout.write(f"cmd: {command}\n")
+            sys.stdout.write(PROMPT)
+            sys.stdout.flush()
+
+def main():
+    args = parse_args()
+    stop = threading.Event()
+    lock = threading.Lock()
+
+    log = open(args.log_file, "w", encoding="utf-8") if args.log_file else None
+    emitters = [Emitter("o", sys.stdout, args.stdout_rate, args.line_size)]
+    if args.stderr_rate:
+        emitters.append(Emitter("e", sys.stderr, args.stderr_rate, args.line_size))
+    if log and args.log_rate:
+        emitters.append(Emitter("l", log, args.log_rate, args.line_size))
+
+    threading.Thread(target=read_console, args=(stop, lock), daemon=True).start()
+
+    with lock:
+        sys.stdout.write("World initialized\n")
+        sys.stdout.write(PROMPT)
+        sys.stdout.flush()
+
+    exit_code = args.exit_code
+    start = time.monotonic()
+    while True:
+        elapsed = min(time.monotonic() - start, args.duration)
+        with lock:
+            for emitter in emitters:
+                emitter.emit_due(elapsed)
+        if stop.is_set():
+            exit_code = 0
+            break
+        if elapsed >= args.duration:
+            break
+        time.sleep(BATCH_INTERVAL)
+
+    with lock:
+        counts = " ".join(f"{emitter.tag}={emitter.count}" for emitter in emitters)
+        sys.stdout.write(f"done {counts}\n")
+        sys.stdout.flush()
+    if log:
+        log.close()
+    sys.exit(exit_code)
+
+if __name__ == "__main__":
+    main()
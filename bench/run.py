@@ -0,0 +1,364 @@
+import argparse
+import os
+import shlex
+import stat
+import sys
+import tempfile
+import threading
+import time
+import psutil
+from config.settings import RealmSettings
+from core.logger import Logger
+from core.mainloop import MainLoop
+from core.supervisor import Supervisor
+from bench.fake_database import FakeDatabase
+
+# Throughput and latency benchmark of the supervision core, no display needed.
+# python -m bench.run [--rates 1000,10000,50000] [--duration 5] [--exit-code 2]
+#
+# The fake worldserver (bench/fake_worldserver.py) is started through
+# Realm.start_worldserver for every rate, its lines go through the reactor,
+# the log tailer and core.logger.Logger exactly like in the manager. The Tk
+# widgets are replaced by MemoryText and the Tk loop by core.mainloop.MainLoop.
+
+FAKE_WORLDSERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_worldserver.py")
+
+# Interval of the heartbeat timer used to measure UI loop responsiveness (ms)
+HEARTBEAT_MS = 20
+# Interval between "ping" console commands during a run (s)
+PING_INTERVAL = 0.2
+# How long to wait for the last lines to arrive after the fake server exited (s)
+DRAIN_TIMEOUT = 10
+
+class BenchSettings:
+    """The settings Supervisor reads, pointing at the fake worldserver."""
+
+    def __init__(self, directory, args):
+        self.RESTART_WORLDSERVER_ON_CRASH = True
+        # Restart right away and without limit, the manager's own cost is measured
+        self.RESTART_INITIAL_DELAY = "0"
+        self.RESTART_MAX_DELAY = "0"
+        self.RESTART_MULTIPLIER = "1"
+        self.RESTART_MAX_COUNT = "0"
+        self.RESTART_WINDOW = "600"
+        self.RESTART_STABLE_AFTER = "300"
+        self.SPILL_DIRECTORY = directory
+        self.INDEX_LOGS = True
+        self.STATS_INTERVAL = str(args.stats_interval)
+        self.RESOURCE_INTERVAL = "1"
+        self.DATABASE_POOL_SIZE = "4"
+        self.DATABASE_TIMEOUT = "5"
+        self.DATABASE_CHARACTERS = "acore_characters"
+        self.DATABASE_AUTH = "acore_auth"
+        self.METRICS_FILE = os.path.join(directory, "metrics.bin")
+        self.API_HOST = "127.0.0.1"
+        self.API_PORT = "0"
+        self.API_SOCKET = ""
+        self.API_TOKEN = ""
+        self.METRICS_HOST = "127.0.0.1"
+        self.METRICS_PORT = "0"
+        self.WORLD_PATH = os.path.join(directory, "worldserver")
+        self.WORLD_LOG_FILE = os.path.join(directory, "Server.log")
+        self.REALMS = [RealmSettings("main", "Bench", self.WORLD_PATH, self.WORLD_LOG_FILE)]
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+class Recorder:
+    """Collects what reaches the log widgets, called on the loop thread."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.counts = {"o": 0, "e": 0, "l": 0}
+        self.latencies = []
+        self.command_rtts = []
+        self.first_arrival = None
+        self.last_arrival = None
+        self.emitted = None
+
+    def on_command(self, sent, future):
+        # Completed by the realm's CommandChannel once the prompt came back
+        if future.exception() is None:
+            self.command_rtts.append(time.monotonic() - sent)
+
+    def _latency(self, line, now):
+        parts = line.split(" ", 3)
+        if len(parts) >= 3 and parts[0].startswith("#"):
+            try:
+                self.latencies.append(now - float(parts[2]))
+            except ValueError:
+                pass
+
+    def on_text(self, text):
+        now = time.time()
+        generated = 0
+        for tag in self.counts:
+            count = text.count(f"#{tag} ")
+            self.counts[tag] += count
+            generated += count
+        if generated:
+            if self.first_arrival is None:
+                self.first_arrival = now
+            self.last_arrival = now
+            # The oldest and newest line of every insert bound the latency
+            first = text[:text.find("\n")]
+            last = text[text.rfind("\n", 0, len(text) - 1) + 1:].rstrip("\n")
+            self._latency(first, now)
+            self._latency(last, now)
+
+        index = text.find("done ")
+        if index != -1:
+            end = text.find("\n", index)
+            self.emitted = sum(int(part.split("=")[1]) for part in text[index + 5:end].split())
+
+    @property
+    def received(self):
+        return sum(self.counts.values())
+
+class MemoryText:
+    """Enough of tk.Text for core.logger.Pane, records text instead of drawing it."""
+
+    def __init__(self, recorder=None):
+        self.recorder = recorder
+
+    def config(self, **kwargs):
+        pass
+
+    def insert(self, index, *chunks):
+        # (text, tags, text, tags, ...) like tk.Text
+        if self.recorder:
+            self.recorder.on_text("".join(chunks[::2]))
+
+    def tag_configure(self, tag, **options):
+        pass
+
+    def see(self, index):
+        pass
+
+    def get(self, start, end):
+        return ""
+
+    def delete(self, start, end):
+        pass
+
+class Heartbeat:
+    """Timer on the loop measuring how late callbacks run, like a frozen UI would."""
+
+    def __init__(self, loop, logger):
+        self.loop = loop
+        self.logger = logger
+        self.reset()
+
+    def reset(self):
+        self.lags = []
+        self.max_queue = 0
+
+    def start(self):
+        self._expected = time.monotonic() + HEARTBEAT_MS / 1000
+        self.loop.after(HEARTBEAT_MS, self.beat)
+
+    def beat(self):
+        now = time.monotonic()
+        self.lags.append(max(0.0, now - self._expected))
+        self.max_queue = max(self.max_queue, self.logger.queue_depth())
+        self.start()
+
+class Benchmark:
+    def __init__(self, args, directory):
+        self.args = args
+        self.settings = BenchSettings(directory, args)
+        self.process = psutil.Process()
+
+        self.loop = MainLoop()
+        self.recorder = Recorder()
+        # No rate limit, every generated line has to reach the recorder
+        self.logger = Logger(root=self.loop, spill_dir=None, line_rate=0)
+        self.logger.add_pane("manager", MemoryText())
+        self.supervisor = Supervisor(self.settings, self.loop, self.logger)
+        self.realm = self.supervisor.realms[0]
+        self.logger.add_pane(self.realm.world_key, MemoryText(self.recorder), 20000)
+
+        # Stats queries hit the stand-in instead of MySQL
+        self.database = FakeDatabase(latency=args.db_latency)
+        self.supervisor.db = self.database
+        self.supervisor.stats.db = self.database
+
+        self.heartbeat = Heartbeat(self.loop, self.logger)
+
+    def write_wrapper(self, rate):
+        # Realm.start_worldserver runs WORLD_PATH without arguments
+        args = self.args
+        stderr_rate = rate * args.stderr_share
+        log_rate = rate * args.log_share
+        command = [
+            sys.executable, FAKE_WORLDSERVER,
+            "--stdout-rate", str(rate - stderr_rate - log_rate),
+            "--stderr-rate", str(stderr_rate),
+            "--log-rate", str(log_rate),
+            "--log-file", self.settings.WORLD_LOG_FILE,
+            "--line-size", str(args.line_size),
+            "--duration", str(args.duration),
+            "--exit-code", str(args.exit_code),
+        ]
+        with open(self.settings.WORLD_PATH, "w") as f:
+            f.write("#!/bin/sh\nexec " + " ".join(shlex.quote(part) for part in command) + "\n")
+        os.chmod(self.settings.WORLD_PATH, os.stat(self.settings.WORLD_PATH).st_mode | stat.S_IXUSR)
+
+    def wait_for(self, condition, timeout):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def ping(self):
+        sent = time.monotonic()
+        future = self.realm.execute(f"ping {time.time():.6f}")
+        future.add_done_callback(lambda future: self.recorder.on_command(sent, future))
+
+    def run_rate(self, rate):
+        # The exit of the previous run is handled on the loop, wait for it
+        if not self.wait_for(lambda: self.realm.world_process is None, 30):
+            raise RuntimeError("previous fake worldserver is still running")
+        self.write_wrapper(rate)
+        if os.path.exists(self.settings.WORLD_LOG_FILE):
+            os.remove(self.settings.WORLD_LOG_FILE)
+
+        self.recorder.reset()
+        self.heartbeat.reset()
+        queries = self.database.queries
+        downtimes = len(self.realm.downtimes)
+        cpu_before = sum(self.process.cpu_times()[:2])
+        started = time.monotonic()
+        max_rss = 0
+        max_threads = 0
+
+        self.loop.post(self.realm.start_worldserver)
+        if not self.wait_for(lambda: self.realm.world_process is not None, 10):
+            raise RuntimeError("fake worldserver did not start")
+        server = self.realm.world_process
+
+        next_ping = time.monotonic()
+        while server.poll() is None:
+            if time.monotonic() >= next_ping:
+                self.loop.post(self.ping)
+                next_ping += PING_INTERVAL
+            max_rss = max(max_rss, self.process.memory_info().rss)
+            max_threads = max(max_threads, self.process.num_threads())
+            time.sleep(0.05)
+
+        drained = self.wait_for(
+            lambda: self.recorder.emitted is not None and self.recorder.received >= self.recorder.emitted,
+            DRAIN_TIMEOUT,
+        )
+
+        elapsed = time.monotonic() - started
+        cpu = (sum(self.process.cpu_times()[:2]) - cpu_before) / elapsed * 100
+        # Taken before a restart adds the lines of the next server
+        recorder = self.recorder
+        spread = (recorder.last_arrival or 0) - (recorder.first_arrival or 0)
+
+        result = {
+            "rate": rate,
+            "emitted": recorder.emitted or 0,
+            "received": recorder.received,
+            "drained": drained,
+            "throughput": recorder.received / spread if spread > 0 else 0.0,
+            "p50": percentile(recorder.latencies, 50) * 1000,
+            "p99": percentile(recorder.latencies, 99) * 1000,
+            "max": max(recorder.latencies, default=0) * 1000,
+            "command_p50": percentile(recorder.command_rtts, 50) * 1000,
+            "ui_p99": percentile(self.heartbeat.lags, 99) * 1000,
+            "ui_max": max(self.heartbeat.lags, default=0) * 1000,
+            "max_queue": self.heartbeat.max_queue,
+            "cpu": cpu,
+            "rss": max_rss / (1024 ** 2),
+            "threads": max_threads,
+            "stats_queries": self.database.queries - queries,
+            "restart": None,
+        }
+
+        if server.returncode in (1, 2):
+            # The supervisor restarts the server and measures exit to world ready
+            if self.wait_for(lambda: len(self.realm.downtimes) > downtimes, 30):
+                result["restart"] = self.realm.downtimes[-1].time_to_ready
+                restarted = self.realm.world_process
+                self.loop.post(self.realm.stop_worldserver)
+                if restarted:
+                    self.wait_for(lambda: restarted.poll() is not None, 30)
+        return result
+
+    def run(self):
+        thread = threading.Thread(target=self.loop.run, name="main-loop", daemon=True)
+        self.loop.post(self.supervisor.start)
+        self.loop.post(self.heartbeat.start)
+        thread.start()
+
+        results = []
+        try:
+            for rate in self.args.rates:
+                results.append(self.run_rate(rate))
+        finally:
+            self.loop.post(self.supervisor.shutdown)
+            self.loop.post(self.loop.stop)
+            thread.join(10)
+        return results
+
+def sustained(result, max_latency):
+    return result["drained"] and result["received"] >= result["emitted"] and result["p99"] <= max_latency
+
+def format_report(args, results):
+    lines = [
+        f"Benchmark {time.strftime('%Y-%m-%d %H:%M:%S')} on {sys.platform}, python {sys.version.split()[0]}",
+        f"duration {args.duration}s per rate, line size {args.line_size}B, stderr {args.stderr_share:.0%}, "
+        f"log file {args.log_share:.0%}, exit code {args.exit_code}, DB latency {args.db_latency * 1000:.0f} ms",
+        "",
+        f"{'target/s':>9} {'received':>9} {'lines/s':>9} {'p50 ms':>7} {'p99 ms':>7} {'max ms':>7} "
+        f"{'cmd ms':>7} {'ui p99':>7} {'ui max':>7} {'queue':>6} {'cpu %':>6} {'rss MB':>7} {'thr':>4} {'db q':>5} {'ok':>3}",
+    ]
+    for r in results:
+        lines.append(
+            f"{r['rate']:>9.0f} {r['received']:>9} {r['throughput']:>9.0f} {r['p50']:>7.1f} {r['p99']:>7.1f} {r['max']:>7.1f} "
+            f"{r['command_p50']:>7.1f} {r['ui_p99']:>7.1f} {r['ui_max']:>7.1f} {r['max_queue']:>6} {r['cpu']:>6.1f} "
+            f"{r['rss']:>7.1f} {r['threads']:>4} {r['stats_queries']:>5} {'yes' if sustained(r, args.max_latency) else 'no':>3}"
+        )
+        if r["restart"] is not None:
+            lines.append(f"{'':>9} restart after exit code {args.exit_code}: {r['restart'] * 1000:.0f} ms to world ready")
+
+    best = [r["rate"] for r in results if sustained(r, args.max_latency)]
+    lines.append("")
+    lines.append(f"Max sustained rate: {max(best):.0f} lines/s" if best else "Max sustained rate: none of the tested rates")
+    return "\n".join(lines) + "\n"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the supervision core with a fake worldserver.")
+    parser.add_argument("--rates", default="1000,5000,20000,50000", help="comma separated target lines/s")
+    parser.add_argument("--duration", type=float, default=5, help="seconds per rate")
+    parser.add_argument("--line-size", type=int, default=120, help="approximate bytes per line")
+    parser.add_argument("--stderr-share", type=float, default=0.1, help="fraction of lines on stderr")
+    parser.add_argument("--log-share", type=float, default=0.3, help="fraction of lines written to the log file")
+    parser.add_argument("--exit-code", type=int, default=0, help="exit code of the fake server, 1/2 also measure the restart")
+    parser.add_argument("--db-latency", type=float, default=0.005, help="seconds per fake stats query")
+    parser.add_argument("--stats-interval", type=float, default=1, help="seconds between stats queries")
+    parser.add_argument("--max-latency", type=float, default=1000, help="p99 latency in ms a sustained rate may have")
+    parser.add_argument("--output", default="bench_output.txt", help="report file, empty to only print")
+    args = parser.parse_args()
+    args.rates = [float(rate) for rate in args.rates.split(",")]
+
+    with tempfile.TemporaryDirectory(prefix="azerothmanager-bench-") as directory:
+        results = Benchmark(args, directory).run()
+
+    report = format_report(args, results)
+    sys.stdout.write(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+
+if __name__ == "__main__":
+    main()
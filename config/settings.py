@@ -2,6 +2,20 @@ import configparser
 import os
 
 SETTINGS_FILE = "settings.ini"
+# Extra realms are configured in sections like [Realm.ptr]
+REALM_SECTION_PREFIX = "Realm."
+
+class RealmSettings:
+    """Paths and database of one worldserver (and optional authserver)."""
+
+    def __init__(self, id, name, world_path, world_log_file, auth_path=None, auth_log_file=None, database_characters=None):
+        self.ID = id
+        self.NAME = name
+        self.WORLD_PATH = world_path
+        self.WORLD_LOG_FILE = world_log_file
+        self.AUTH_PATH = auth_path
+        self.AUTH_LOG_FILE = auth_log_file
+        self.DATABASE_CHARACTERS = database_characters
 
 class SettingsManager:
     def __init__(self):
@@ -22,6 +36,16 @@ class SettingsManager:
         }
         self.config['General'] = {
             'restart_worldserver_on_crash': '1',
+            'stats_interval': '10',
+            'resource_interval': '3',
+        }
+        self.config['Restart'] = {
+            'initial_delay': '5',
+            'max_delay': '300',
+            'multiplier': '2',
+            'max_restarts': '5',
+            'window': '600',
+            'stable_after': '300',
         }
         self.config['Database'] = {
             'database_host': '127.0.0.1',
@@ -31,6 +55,31 @@ class SettingsManager:
             'database_world': 'acore_world',
             'database_characters': 'acore_characters',
             'database_auth': 'acore_auth',
+            'database_pool_size': '4',
+            'database_timeout': '5',
+        }
+        self.config['Logging'] = {
+            'max_lines_manager': '5000',
+            'max_lines_auth': '10000',
+            'max_lines_world': '20000',
+            'spill_directory': 'logs',
+            'index_logs': 'True',
+            'line_rate': '2000',
+        }
+        self.config['Accounts'] = {
+            'command_rate': '20',
+            'batch_size': '5',
+        }
+        self.config['Metrics'] = {
+            'metrics_file': 'metrics.bin',
+            'host': '127.0.0.1',
+            'port': '0',
+        }
+        self.config['API'] = {
+            'host': '127.0.0.1',
+            'port': '0',
+            'socket': '',
+            'token': '',
         }
         with open(SETTINGS_FILE, 'w') as configfile:
             self.config.write(configfile)
@@ -46,6 +95,8 @@ class SettingsManager:
         return self.config.getboolean(section, key, fallback=fallback)
 
     def set(self, section, key, value):
+        if not self.config.has_section(section):
+            self.config.add_section(section)
         self.config.set(section, key, str(value))
 
     def load_settings(self):      
@@ -54,6 +105,14 @@ class SettingsManager:
         self.WORLD_LOG_FILE = self.get('Paths', 'world_log_file')
         self.AUTH_LOG_FILE = self.get('Paths', 'auth_log_file')
         self.RESTART_WORLDSERVER_ON_CRASH = self.getboolean('General', 'restart_worldserver_on_crash')
+        self.STATS_INTERVAL = self.get('General', 'stats_interval', fallback='10')
+        self.RESOURCE_INTERVAL = self.get('General', 'resource_interval', fallback='3')
+        self.RESTART_INITIAL_DELAY = self.get('Restart', 'initial_delay', fallback='5')
+        self.RESTART_MAX_DELAY = self.get('Restart', 'max_delay', fallback='300')
+        self.RESTART_MULTIPLIER = self.get('Restart', 'multiplier', fallback='2')
+        self.RESTART_MAX_COUNT = self.get('Restart', 'max_restarts', fallback='5')
+        self.RESTART_WINDOW = self.get('Restart', 'window', fallback='600')
+        self.RESTART_STABLE_AFTER = self.get('Restart', 'stable_after', fallback='300')
         self.DATABASE_HOST = self.get('Database', 'database_host')
         self.DATABASE_PORT = self.get('Database', 'database_port')
         self.DATABASE_USER = self.get('Database', 'database_user')
@@ -61,6 +120,50 @@ class SettingsManager:
         self.DATABASE_WORLD = self.get('Database', 'database_world')
         self.DATABASE_CHARACTERS = self.get('Database', 'database_characters')
         self.DATABASE_AUTH = self.get('Database', 'database_auth')
+        self.DATABASE_POOL_SIZE = self.get('Database', 'database_pool_size', fallback='4')
+        self.DATABASE_TIMEOUT = self.get('Database', 'database_timeout', fallback='5')
+        self.MAX_LINES_MANAGER = self.get('Logging', 'max_lines_manager', fallback='5000')
+        self.MAX_LINES_AUTH = self.get('Logging', 'max_lines_auth', fallback='10000')
+        self.MAX_LINES_WORLD = self.get('Logging', 'max_lines_world', fallback='20000')
+        self.SPILL_DIRECTORY = self.get('Logging', 'spill_directory', fallback='logs')
+        self.INDEX_LOGS = self.getboolean('Logging', 'index_logs', fallback=True)
+        self.LOG_LINE_RATE = self.get('Logging', 'line_rate', fallback='2000')
+        self.METRICS_FILE = self.get('Metrics', 'metrics_file', fallback='metrics.bin')
+        self.METRICS_HOST = self.get('Metrics', 'host', fallback='127.0.0.1')
+        self.METRICS_PORT = self.get('Metrics', 'port', fallback='0')
+        self.ACCOUNT_COMMAND_RATE = self.get('Accounts', 'command_rate', fallback='20')
+        self.ACCOUNT_BATCH_SIZE = self.get('Accounts', 'batch_size', fallback='5')
+        self.API_HOST = self.get('API', 'host', fallback='127.0.0.1')
+        self.API_PORT = self.get('API', 'port', fallback='0')
+        self.API_SOCKET = self.get('API', 'socket', fallback='')
+        self.API_TOKEN = self.get('API', 'token', fallback='')
+        self.REALMS = self.load_realms()
+
+    def load_realms(self):
+        # [Paths] is always the main realm, [Realm.<id>] sections add more
+        realms = [RealmSettings(
+            'main',
+            self.get('General', 'realm_name', fallback='Main'),
+            self.WORLD_PATH,
+            self.WORLD_LOG_FILE,
+            self.AUTH_PATH,
+            self.AUTH_LOG_FILE,
+            self.DATABASE_CHARACTERS,
+        )]
+        for section in self.config.sections():
+            if not section.startswith(REALM_SECTION_PREFIX):
+                continue
+            realm_id = section[len(REALM_SECTION_PREFIX):]
+            realms.append(RealmSettings(
+                realm_id,
+                self.get(section, 'name', fallback=realm_id),
+                self.get(section, 'worldserver'),
+                self.get(section, 'world_log_file'),
+                self.get(section, 'authserver') or None,
+                self.get(section, 'auth_log_file') or None,
+                self.get(section, 'database_characters', fallback=self.DATABASE_CHARACTERS),
+            ))
+        return realms
 
     def save_settings(self):
         self.set('Paths', 'worldserver', self.WORLD_PATH)
@@ -68,6 +171,14 @@ class SettingsManager:
         self.set('Paths', 'world_log_file', self.WORLD_LOG_FILE)
         self.set('Paths', 'auth_log_file', self.AUTH_LOG_FILE)
         self.set('General', 'restart_worldserver_on_crash', self.RESTART_WORLDSERVER_ON_CRASH)
+        self.set('General', 'stats_interval', self.STATS_INTERVAL)
+        self.set('General', 'resource_interval', self.RESOURCE_INTERVAL)
+        self.set('Restart', 'initial_delay', self.RESTART_INITIAL_DELAY)
+        self.set('Restart', 'max_delay', self.RESTART_MAX_DELAY)
+        self.set('Restart', 'multiplier', self.RESTART_MULTIPLIER)
+        self.set('Restart', 'max_restarts', self.RESTART_MAX_COUNT)
+        self.set('Restart', 'window', self.RESTART_WINDOW)
+        self.set('Restart', 'stable_after', self.RESTART_STABLE_AFTER)
         self.set('Database', 'database_host', self.DATABASE_HOST)
         self.set('Database', 'database_port', self.DATABASE_PORT)
         self.set('Database', 'database_user', self.DATABASE_USER)
@@ -75,5 +186,22 @@ class SettingsManager:
         self.set('Database', 'database_world', self.DATABASE_WORLD)
         self.set('Database', 'database_characters', self.DATABASE_CHARACTERS)
         self.set('Database', 'database_auth', self.DATABASE_AUTH)
+        self.set('Database', 'database_pool_size', self.DATABASE_POOL_SIZE)
+        self.set('Database', 'database_timeout', self.DATABASE_TIMEOUT)
+        self.set('Logging', 'max_lines_manager', self.MAX_LINES_MANAGER)
+        self.set('Logging', 'max_lines_auth', self.MAX_LINES_AUTH)
+        self.set('Logging', 'max_lines_world', self.MAX_LINES_WORLD)
+        self.set('Logging', 'spill_directory', self.SPILL_DIRECTORY)
+        self.set('Logging', 'index_logs', self.INDEX_LOGS)
+        self.set('Logging', 'line_rate', self.LOG_LINE_RATE)
+        self.set('Metrics', 'metrics_file', self.METRICS_FILE)
+        self.set('Metrics', 'host', self.METRICS_HOST)
+        self.set('Metrics', 'port', self.METRICS_PORT)
+        self.set('Accounts', 'command_rate', self.ACCOUNT_COMMAND_RATE)
+        self.set('Accounts', 'batch_size', self.ACCOUNT_BATCH_SIZE)
+        self.set('API', 'host', self.API_HOST)
+        self.set('API', 'port', self.API_PORT)
+        self.set('API', 'socket', self.API_SOCKET)
+        self.set('API', 'token', self.API_TOKEN)
 
         self.save()
@@ -0,0 +1,234 @@
+import collections
+import csv
+import json
+import re
+from core.commands import CommandTimeout, ServerNotRunning
+
+# Client limits enforced by the worldserver (MAX_ACCOUNT_STR / MAX_PASS_STR)
+MAX_USERNAME_LENGTH = 20
+MAX_PASSWORD_LENGTH = 16
+MAX_GMLEVEL = 3
+
+# Seconds to wait for the worldserver to answer a sent command
+RESPONSE_TIMEOUT = 15
+
+# Console replies of successful commands
+CREATED = re.compile(r"Account created: (\S+)", re.IGNORECASE)
+GMLEVEL_SET = re.compile(r"You change security level of account (\S+) to (\d+)", re.IGNORECASE)
+
+def validate_account(username, password, gmlevel):
+    """Return an error message, or None when the values can be sent as is."""
+    if not username or not password:
+        return "username and password cannot be empty"
+    # Console arguments are separated by spaces
+    if any(c.isspace() for c in username + password):
+        return "username and password cannot contain spaces"
+    if len(username) > MAX_USERNAME_LENGTH:
+        return f"username is longer than {MAX_USERNAME_LENGTH} characters"
+    if len(password) > MAX_PASSWORD_LENGTH:
+        return f"password is longer than {MAX_PASSWORD_LENGTH} characters"
+    try:
+        level = int(gmlevel)
+    except (TypeError, ValueError):
+        return f"gmlevel '{gmlevel}' is not a number"
+    if not 0 <= level <= MAX_GMLEVEL:
+        return f"gmlevel must be between 0 and {MAX_GMLEVEL}"
+    return None
+
+class AccountRow:
+    """One account of a bulk import and its progress."""
+
+    QUEUED = "queued"
+    SENT = "sent"
+    CREATED = "created"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, line, username, password, gmlevel=0):
+        self.line = line
+        self.username = username
+        self.password = password
+        self.gmlevel = int(gmlevel)
+        self.status = AccountRow.QUEUED
+        self.message = ""
+
+    @property
+    def finished(self):
+        return self.status in (AccountRow.DONE, AccountRow.FAILED)
+
+def _read_records(path):
+    # (line number, dict) for each account in a CSV or JSON file
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("accounts", [])
+        if not isinstance(data, list):
+            raise ValueError('expected a list of accounts or {"accounts": [...]}')
+        return [(index, record) for index, record in enumerate(data, start=1)]
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        lines = [(number, values) for number, values in enumerate(csv.reader(f), start=1) if values]
+    columns = ["username", "password", "gmlevel"]
+    if lines and lines[0][1][0].strip().lower() == "username":
+        # Header row, columns may come in any order
+        columns = [value.strip().lower() for value in lines.pop(0)[1]]
+    return [(number, dict(zip(columns, values))) for number, values in lines]
+
+def load_accounts(path):
+    """Read and validate a CSV (username,password[,gmlevel]) or JSON account list.
+
+    Returns (rows, errors); nothing should be sent while errors is not empty.
+    """
+    rows = []
+    errors = []
+    seen = set()
+    for line, record in _read_records(path):
+        if not isinstance(record, dict):
+            errors.append(f"line {line}: expected username, password and gmlevel")
+            continue
+        username = str(record.get("username") or "").strip()
+        password = str(record.get("password") or "").strip()
+        gmlevel = str(record.get("gmlevel") or "0").strip()
+
+        error = validate_account(username, password, gmlevel)
+        if error is None and username.upper() in seen:
+            error = f"duplicate username {username}"
+        if error:
+            errors.append(f"line {line}: {error}")
+            continue
+        seen.add(username.upper())
+        rows.append(AccountRow(line, username, password, gmlevel))
+    return rows, errors
+
+class CommandPipeline:
+    """Single writer sending console commands in batches at a bounded rate.
+
+    Runs on the scheduler thread; rate is commands per second. send() returns
+    the command's Future, which is handed to on_sent.
+    """
+
+    def __init__(self, scheduler, send, rate=20, batch_size=5):
+        self.scheduler = scheduler
+        self.send = send
+        self.rate = max(0.1, float(rate))
+        self.batch_size = max(1, int(batch_size))
+        self._queue = collections.deque()
+        self._scheduled = False
+
+    def put(self, command, display=None, on_sent=None):
+        self._queue.append((command, display, on_sent))
+        if not self._scheduled:
+            self._scheduled = True
+            self.scheduler.after(0, self._tick)
+
+    def cancel(self):
+        self._queue.clear()
+
+    @property
+    def pending(self):
+        return len(self._queue)
+
+    def _tick(self):
+        for _ in range(min(self.batch_size, len(self._queue))):
+            command, display, on_sent = self._queue.popleft()
+            future = self.send(command, display)
+            if on_sent:
+                on_sent(future)
+
+        if self._queue:
+            self.scheduler.after(int(self.batch_size / self.rate * 1000), self._tick)
+        else:
+            self._scheduled = False
+
+class BulkAccountImport:
+    """Creates accounts through a realm's console and checks every reply.
+
+    Each command's reply comes back through the realm's CommandChannel, so
+    replies are matched to accounts even when other commands run meanwhile.
+    on_progress(row) runs on the scheduler thread after each status change.
+    """
+
+    def __init__(self, realm, rows, rate=20, batch_size=5, on_progress=None):
+        self.realm = realm
+        self.rows = rows
+        self.on_progress = on_progress
+        self.pipeline = CommandPipeline(realm.supervisor.scheduler, self.send, rate, batch_size)
+
+    @property
+    def finished(self):
+        return all(row.finished for row in self.rows)
+
+    def counts(self):
+        counts = collections.Counter(row.status for row in self.rows)
+        return counts[AccountRow.DONE], counts[AccountRow.FAILED], len(self.rows)
+
+    def send(self, command, display):
+        return self.realm.execute(command, timeout=RESPONSE_TIMEOUT, display=display)
+
+    def start(self):
+        for row in self.rows:
+            self.pipeline.put(
+                f"account create {row.username} {row.password}",
+                display=f"account create {row.username} ********",
+                on_sent=lambda future, row=row: self._sent(row, future),
+            )
+
+    def cancel(self):
+        self.pipeline.cancel()
+        for row in self.rows:
+            if not row.finished:
+                self._update(row, AccountRow.FAILED, "cancelled")
+
+    def _update(self, row, status, message=""):
+        row.status = status
+        row.message = message
+        if self.on_progress:
+            self.on_progress(row)
+
+    def _sent(self, row, future):
+        if row.finished:
+            return
+        self._update(row, AccountRow.SENT)
+        future.add_done_callback(lambda future: self._created(row, future))
+
+    def _reply(self, row, future):
+        # The command's output, or None after marking the row failed
+        if row.finished:
+            return None
+        try:
+            return future.result()
+        except CommandTimeout:
+            self._update(row, AccountRow.FAILED, "no reply from the worldserver")
+        except ServerNotRunning:
+            self._update(row, AccountRow.FAILED, "worldserver is not running")
+        except Exception as e:
+            self._update(row, AccountRow.FAILED, str(e))
+        return None
+
+    def _created(self, row, future):
+        result = self._reply(row, future)
+        if result is None:
+            return
+        if not CREATED.search(result.text):
+            self._update(row, AccountRow.FAILED, " ".join(result.lines) or "account not created")
+            return
+        if row.gmlevel == 0:
+            self._update(row, AccountRow.DONE, "created")
+            return
+
+        self._update(row, AccountRow.CREATED)
+        self.pipeline.put(
+            f"account set gmlevel {row.username} {row.gmlevel} -1",
+            on_sent=lambda future: future.add_done_callback(lambda future: self._gmlevel_set(row, future)),
+        )
+
+    def _gmlevel_set(self, row, future):
+        result = self._reply(row, future)
+        if result is None:
+            return
+        match = GMLEVEL_SET.search(result.text)
+        if match:
+            self._update(row, AccountRow.DONE, f"created, gmlevel {match.group(2)}")
+        else:
+            self._update(row, AccountRow.FAILED, "created, but setting gmlevel failed")
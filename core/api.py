@@ -0,0 +1,292 @@
+import asyncio
+import hmac
+import json
+import os
+import urllib.parse
+from concurrent.futures import Future
+from core import prometheus
+from core.commands import CommandTimeout, ServerNotRunning
+
+# Largest request line + headers + body accepted (bytes)
+MAX_REQUEST_SIZE = 64 * 1024
+# Keep-alive connections idle for this long are closed (s)
+IDLE_TIMEOUT = 30
+# Upper bound of log lines returned per request
+MAX_LOG_LINES = 1000
+# Seconds to wait for work handed to the scheduler thread (s)
+SCHEDULER_TIMEOUT = 10
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    504: "Gateway Timeout",
+}
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class Request:
+    def __init__(self, method, path, query, headers, body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def param(self, name, default=None):
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    def int_param(self, name, default=None):
+        value = self.param(name)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise HttpError(400, f"{name} must be a number")
+
+    def json(self):
+        try:
+            data = json.loads(self.body or b"{}")
+        except ValueError:
+            raise HttpError(400, "body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HttpError(400, "body must be a JSON object")
+        return data
+
+class ControlServer:
+    """Local HTTP/JSON API for ops tooling, served from the reactor loop.
+
+    GET  /api/status   realms, processes, resources and players (cached)
+    GET  /api/logs     recent log lines, ?source=&cursor=&limit=
+    POST /api/command  {"realm": id, "command": "...", "timeout": s}
+    GET  /api/boots    latest boot profile of ?realm=, slowest load phases first
+    GET  /metrics      Prometheus text format of the same cached state
+
+    metrics_only serves nothing but /metrics, for a scrape port without
+    access to logs or the console.
+
+    Reads never scan processes or query MySQL: status is the StateCache the
+    supervisor rebuilds on its own schedule and logs come from the logger's
+    LogHistory. Commands are handed to the realm's CommandChannel on the
+    scheduler thread and the reply is awaited without blocking the loop.
+    """
+
+    def __init__(self, supervisor, host="127.0.0.1", port=0, socket_path=None, token=None, metrics_only=False):
+        self.supervisor = supervisor
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.token = token
+        self.server = None
+        self.routes = {"/metrics": {"GET": self.get_metrics}}
+        if not metrics_only:
+            self.routes.update({
+                "/api/status": {"GET": self.get_status},
+                "/api/logs": {"GET": self.get_logs},
+                "/api/command": {"POST": self.post_command},
+                "/api/boots": {"GET": self.get_boots},
+            })
+
+    @property
+    def address(self):
+        if self.socket_path:
+            return self.socket_path
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.remove(self.socket_path)  # Left behind by an earlier run
+        self.server = self.supervisor.reactor.start_server(
+            self.on_client, host=self.host, port=self.port, path=self.socket_path
+        )
+        if not self.socket_path:
+            # Port 0 binds a free port
+            self.port = self.server.sockets[0].getsockname()[1]
+
+    def stop(self):
+        if self.server:
+            self.supervisor.reactor.close_server(self.server)
+            self.server = None
+
+    # --- HTTP ---
+
+    async def on_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self.read_request(reader), IDLE_TIMEOUT)
+                except HttpError as e:
+                    await self.respond(writer, e.status, self.error_body(e), keep_alive=False)
+                    break
+                if request is None:
+                    break
+                status, body, content_type = await self.dispatch(request)
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                await self.respond(writer, status, body, content_type, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise HttpError(413, "request headers too large")
+        except asyncio.IncompleteReadError as e:
+            if e.partial.strip():
+                raise
+            return None  # Client closed a keep-alive connection
+        if len(head) > MAX_REQUEST_SIZE:
+            raise HttpError(413, "request headers too large")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "malformed request line")
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HttpError(400, "malformed Content-Length")
+        if length > MAX_REQUEST_SIZE:
+            raise HttpError(413, "request body too large")
+        body = await reader.readexactly(length) if length else b""
+
+        url = urllib.parse.urlsplit(target)
+        return Request(method.upper(), url.path, urllib.parse.parse_qs(url.query), headers, body)
+
+    async def respond(self, writer, status, body, content_type="application/json", keep_alive=True):
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    def error_body(self, error):
+        return json.dumps({"error": str(error)}).encode()
+
+    def authorized(self, request):
+        if not self.token:
+            return True
+        supplied = request.headers.get("authorization", "")
+        return hmac.compare_digest(supplied.encode(), f"Bearer {self.token}".encode())
+
+    async def dispatch(self, request):
+        try:
+            if not self.authorized(request):
+                raise HttpError(401, "missing or wrong token")
+            methods = self.routes.get(request.path)
+            if methods is None:
+                raise HttpError(404, f"no such endpoint: {request.path}")
+            handler = methods.get(request.method)
+            if handler is None:
+                raise HttpError(405, f"{request.method} is not allowed here")
+            return await handler(request)
+        except HttpError as e:
+            return e.status, self.error_body(e), "application/json"
+        except Exception as e:
+            self.supervisor.log.manager(f"❗ Control API error on {request.path}: {e}\n")
+            return 500, self.error_body(e), "application/json"
+
+    def json_response(self, data, status=200):
+        return status, json.dumps(data).encode(), "application/json"
+
+    async def on_scheduler(self, fn):
+        # Runs fn on the scheduler thread, its exception is raised here instead of being lost there
+        done = Future()
+
+        def run():
+            try:
+                done.set_result(fn())
+            except Exception as e:
+                done.set_exception(e)
+
+        self.supervisor.executor.post(run)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(done), SCHEDULER_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HttpError(504, "the manager did not answer in time")
+
+    # --- Endpoints ---
+
+    async def get_status(self, request):
+        # Already encoded by the StateCache, nothing to compute per request
+        return 200, self.supervisor.state.body, "application/json"
+
+    async def get_metrics(self, request):
+        # Rendered by the StateCache, a scrape never reaches MySQL or psutil
+        return 200, self.supervisor.state.metrics, prometheus.CONTENT_TYPE
+
+    async def get_logs(self, request):
+        limit = max(1, min(request.int_param("limit", 100), MAX_LOG_LINES))
+        lines, cursor, oldest = self.supervisor.log.history.read(
+            cursor=request.int_param("cursor"),
+            limit=limit,
+            source=request.param("source"),
+        )
+        return self.json_response({
+            "lines": [{"seq": seq, "time": at, "source": source, "text": text} for seq, at, source, text in lines],
+            "cursor": cursor,
+            "oldest": oldest,
+        })
+
+    async def get_boots(self, request):
+        realm_id = request.param("realm")
+        realm = self.supervisor.realm(realm_id) if realm_id else self.supervisor.realms[0]
+        if realm is None:
+            raise HttpError(404, f"unknown realm: {realm_id}")
+        # Boots are stored on the scheduler thread, the report is built there as well
+        profile, phases = await self.on_scheduler(realm.boot_profiler.report)
+        if profile is None:
+            return self.json_response({"realm": realm.id, "boot": None, "phases": []})
+        return self.json_response({
+            "realm": realm.id,
+            "boot": {"started": profile.started, "ready": profile.ready, "total_ms": profile.total_ms},
+            "phases": phases,
+        })
+
+    async def post_command(self, request):
+        data = request.json()
+        command = str(data.get("command") or "").strip()
+        if not command or "\n" in command:
+            raise HttpError(400, "command must be a single non-empty line")
+        realm_id = data.get("realm")
+        realm = self.supervisor.realm(realm_id) if realm_id else self.supervisor.realms[0]
+        if realm is None:
+            raise HttpError(404, f"unknown realm: {realm_id}")
+        timeout = data.get("timeout")
+        if timeout is not None and not isinstance(timeout, (int, float)):
+            raise HttpError(400, "timeout must be a number")
+
+        # CommandChannel only runs on the scheduler thread
+        reply = await self.on_scheduler(lambda: realm.execute(command, timeout, prefix="[API] "))
+        try:
+            result = await asyncio.wrap_future(reply)
+        except ServerNotRunning as e:
+            raise HttpError(409, str(e))
+        except CommandTimeout as e:
+            raise HttpError(504, str(e))
+        return self.json_response({"realm": realm.id, "command": command, "lines": result.lines})
@@ -0,0 +1,164 @@
+import collections
+import json
+import os
+import re
+import statistics
+import threading
+import time
+
+# e.g. ">> Loaded 52034 Creature Templates in 1123 ms", the count is optional
+LOADED = re.compile(r">> Loaded (?:(\d+) )?(.+?) in (\d+) ms")
+# Earlier boots of a realm kept for comparison
+BOOT_HISTORY = 20
+
+class BootPhase:
+    def __init__(self, key, name, rows, ms, at):
+        self.key = key
+        self.name = name
+        self.rows = rows
+        self.ms = ms
+        self.at = at
+
+class BootProfile:
+    """The ">> Loaded" phases of one worldserver boot, in log order."""
+
+    def __init__(self, realm_id, started=None):
+        self.realm_id = realm_id
+        self.started = started if started is not None else time.time()
+        self.ready = None
+        self.phases = []
+        self._seen = collections.Counter()
+
+    @property
+    def total_ms(self):
+        return sum(phase.ms for phase in self.phases)
+
+    def add(self, name, rows, ms, at=None):
+        key = name.lower()
+        if self.phases and key == self.phases[0].key:
+            # The first phase again: the log tail read an older boot from the existing file first
+            self.phases.clear()
+            self._seen.clear()
+        # Phases loaded more than once in a boot are told apart by their order
+        self._seen[key] += 1
+        if self._seen[key] > 1:
+            key = f"{key} #{self._seen[key]}"
+        self.phases.append(BootPhase(key, name, rows, ms, at if at is not None else time.time()))
+
+    def durations(self):
+        return {phase.key: phase.ms for phase in self.phases}
+
+    def to_dict(self):
+        return {
+            "realm": self.realm_id,
+            "started": self.started,
+            "ready": self.ready,
+            "total_ms": self.total_ms,
+            "phases": [[phase.name, phase.rows, phase.ms, phase.at] for phase in self.phases],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        profile = cls(data["realm"], data["started"])
+        profile.ready = data.get("ready")
+        for name, rows, ms, at in data["phases"]:
+            profile.add(name, rows, ms, at)
+        return profile
+
+def compare(profile, earlier):
+    """Phases of profile slowest first, next to the previous boot and the median of earlier boots."""
+    previous = earlier[-1].durations() if earlier else {}
+    history = collections.defaultdict(list)
+    for boot in earlier:
+        for key, ms in boot.durations().items():
+            history[key].append(ms)
+
+    rows = []
+    for phase in sorted(profile.phases, key=lambda phase: phase.ms, reverse=True):
+        median = statistics.median(history[phase.key]) if history[phase.key] else None
+        rows.append({
+            "name": phase.name,
+            "rows": phase.rows,
+            "ms": phase.ms,
+            "previous_ms": previous.get(phase.key),
+            "median_ms": median,
+            # Relative to the median, None for phases without history or too fast to compare
+            "change": (phase.ms - median) / median if median else None,
+        })
+    return rows
+
+class BootProfiler:
+    """Collects the ">> Loaded N ... in X ms" lines of a realm into one profile per boot.
+
+    start() and finish() run on the scheduler thread, feed() is called with
+    log text on the reactor thread. Finished boots are appended to a JSON
+    lines file shared by all realms, the last BOOT_HISTORY are kept around.
+    """
+
+    def __init__(self, path, realm_id, history=BOOT_HISTORY):
+        self.path = path
+        self.realm_id = realm_id
+        self.current = None
+        self.boots = collections.deque(maxlen=history)
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        # An unfinished previous boot (crash while loading) is dropped
+        self.current = BootProfile(self.realm_id)
+
+    def feed(self, text):
+        profile = self.current
+        if profile is None or ">> Loaded" not in text:
+            return
+        for match in LOADED.finditer(text):
+            rows, name, ms = match.groups()
+            with self._lock:
+                profile.add(name.strip(), int(rows) if rows else None, int(ms))
+
+    def finish(self, profile):
+        """Store a boot once its world is ready, returns False without any phases."""
+        if profile is not self.current:
+            return False
+        self.current = None
+        with self._lock:
+            if not profile.phases:
+                return False
+            profile.ready = time.time()
+        self.load()
+        self.boots.append(profile)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(profile.to_dict()) + "\n")
+        return True
+
+    def load(self):
+        # Earlier boots are read once, on first use
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        data = json.loads(line)
+                        if data.get("realm") == self.realm_id:
+                            self.boots.append(BootProfile.from_dict(data))
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Torn last line or edited by hand
+        except FileNotFoundError:
+            pass
+
+    @property
+    def latest(self):
+        self.load()
+        return self.boots[-1] if self.boots else None
+
+    def report(self, profile=None):
+        """(profile, compare() rows) of the given or the latest boot against the boots before it."""
+        self.load()
+        profile = profile or self.latest
+        if profile is None:
+            return None, []
+        earlier = [boot for boot in self.boots if boot is not profile and boot.started < profile.started]
+        return profile, compare(profile, earlier)
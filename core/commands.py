@@ -0,0 +1,144 @@
+import collections
+import time
+from concurrent.futures import Future
+
+# Printed by the worldserver once its console is up and after every command
+PROMPT = "AC>"
+# Seconds a command may take before its future fails with CommandTimeout
+COMMAND_TIMEOUT = 10
+# A timed out command still owns the next prompt; forget it after this many seconds
+STALE_AFTER = 300
+# How often deadlines are checked while commands are outstanding (ms)
+EXPIRY_INTERVAL = 250
+
+class CommandTimeout(Exception):
+    pass
+
+class ServerNotRunning(Exception):
+    pass
+
+class CommandResult:
+    """Console output of one command, prompt removed."""
+
+    def __init__(self, command, lines):
+        self.command = command
+        self.lines = lines
+
+    @property
+    def text(self):
+        return "\n".join(self.lines)
+
+class _Pending:
+    def __init__(self, command, future, deadline):
+        self.command = command
+        self.future = future
+        self.deadline = deadline
+        self.lines = []
+
+class CommandChannel:
+    """Matches worldserver console output to the command that produced it.
+
+    The worldserver runs console commands one after another and prints the
+    "AC>" prompt once when its console starts and again after every command.
+    Commands are written right away and remembered in order; each prompt
+    completes the oldest outstanding command with the lines printed since the
+    previous prompt, so any number of callers can have commands in flight.
+    Lines the server logs on its own while a command runs are captured too.
+
+    execute() must be called on the scheduler thread, which is also where
+    the returned futures complete and run their callbacks.
+    """
+
+    def __init__(self, realm, timeout=COMMAND_TIMEOUT):
+        self.realm = realm
+        self.timeout = timeout
+        self._pending = collections.deque()
+        self._startup_prompt = False
+        self._expiry_scheduled = False
+        realm.add_line_listener(self.on_output)
+
+    def reset(self, started=False, reason="worldserver stopped"):
+        """Fail every outstanding command; started=True for a new process."""
+        while self._pending:
+            pending = self._pending.popleft()
+            if not pending.future.done():
+                pending.future.set_exception(ServerNotRunning(reason))
+        # A fresh console prints one prompt before reading its first command
+        self._startup_prompt = started
+
+    def execute(self, command, timeout=None, prefix="[Input] ", display=None):
+        """Send a console command, returns a Future of its CommandResult."""
+        future = Future()
+        process = self.realm.world_process
+        if not process or process.poll() is not None:
+            future.set_exception(ServerNotRunning(f"{self.realm.world_label} is not running."))
+            return future
+
+        try:
+            process.write(command + '\n')
+        except Exception as e:
+            future.set_exception(e)
+            return future
+
+        # display replaces the echoed command, e.g. to hide a password
+        self.realm.log_world(f"{prefix}{display or command}\n")
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        self._pending.append(_Pending(command, future, deadline))
+        self._schedule_expiry()
+        return future
+
+    @property
+    def outstanding(self):
+        return sum(1 for pending in self._pending if not pending.future.done())
+
+    def on_output(self, text):
+        # Reactor thread: only hop to the scheduler when there is something to match
+        if self._pending or (self._startup_prompt and PROMPT in text):
+            self.realm.supervisor.executor.post(lambda: self.feed(text))
+
+    def feed(self, text):
+        for line in text.splitlines():
+            line = line.rstrip("\r")
+            while line.lstrip().startswith(PROMPT):
+                self._prompt()
+                line = line.lstrip()[len(PROMPT):].lstrip(" ")
+            if line.rstrip().endswith(PROMPT):
+                # Output without a trailing newline followed by the prompt
+                line = line.rstrip()[:-len(PROMPT)]
+                self._line(line)
+                self._prompt()
+                continue
+            self._line(line)
+
+    def _line(self, line):
+        # Boot output comes before the console reads its first command
+        if line.strip() and self._pending and not self._startup_prompt:
+            self._pending[0].lines.append(line)
+
+    def _prompt(self):
+        if self._startup_prompt:
+            # The console only starts once the world is loaded
+            self._startup_prompt = False
+            self.realm.on_world_ready()
+            return
+        if self._pending:
+            pending = self._pending.popleft()
+            if not pending.future.done():
+                pending.future.set_result(CommandResult(pending.command, pending.lines))
+
+    def _schedule_expiry(self):
+        if not self._expiry_scheduled:
+            self._expiry_scheduled = True
+            self.realm.supervisor.scheduler.after(EXPIRY_INTERVAL, self._expire)
+
+    def _expire(self):
+        self._expiry_scheduled = False
+        now = time.monotonic()
+        for pending in self._pending:
+            if not pending.future.done() and now > pending.deadline:
+                pending.future.set_exception(CommandTimeout(f"No reply to '{pending.command}'"))
+        # Timed out commands keep their place until their prompt shows up
+        while self._pending and self._pending[0].future.done() and now > self._pending[0].deadline + STALE_AFTER:
+            self._pending.popleft()
+        if self._pending:
+            self._schedule_expiry()
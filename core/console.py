@@ -0,0 +1,47 @@
+import sys
+import threading
+import time
+from core.loghistory import LogHistory
+
+class ConsoleLogger:
+    """Logger for the headless daemon, writes every source to one stream.
+
+    Offers the same write(source, text) and manager(text) as core.logger.Logger
+    and may be called from any thread.
+    """
+
+    def __init__(self, stream=None):
+        self._stream = stream or sys.stdout
+        self._lock = threading.Lock()
+        self.history = LogHistory()
+
+        self._lines_in_window = 0
+        self._window_start = time.monotonic()
+        self.lines_per_second = 0.0
+
+    def write(self, source, text):
+        with self._lock:
+            for line in text.splitlines(True):
+                self._stream.write(f"[{source}] {line}")
+                self._lines_in_window += 1
+            self._stream.flush()
+            self.history.append(source, text)
+            self._update_rate()
+
+    def _update_rate(self):
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.lines_per_second = self._lines_in_window / elapsed
+            self._lines_in_window = 0
+            self._window_start = now
+
+    def stats(self):
+        return {
+            "lines_per_second": round(self.lines_per_second, 1),
+            "queue_depth": 0,
+            "lines_suppressed": 0,
+        }
+
+    def manager(self, text: str):
+        self.write("manager", text)
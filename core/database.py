@@ -0,0 +1,111 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# Seconds between tries for a connection while every pooled one is borrowed
+POOL_WAIT_INTERVAL = 0.05
+
+# mysql.connector is imported by the first query, which runs on a worker thread
+
+class DatabasePool:
+    """Shared pool of MySQL connections to the characters database."""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _create_pool(self):
+        from mysql.connector import pooling
+        from mysql.connector.constants import DEFAULT_CONFIGURATION
+        timeout = max(1, int(float(self.settings.DATABASE_TIMEOUT)))
+        # connection_timeout only covers the connect on recent connectors, reads
+        # and writes have their own timeouts there so a hung DB frees the worker
+        socket_timeouts = {}
+        if "read_timeout" in DEFAULT_CONFIGURATION:
+            socket_timeouts = {"read_timeout": timeout, "write_timeout": timeout}
+        return pooling.MySQLConnectionPool(
+            pool_name="azerothmanager",
+            pool_size=max(1, int(self.settings.DATABASE_POOL_SIZE)),
+            pool_reset_session=True,
+            host=self.settings.DATABASE_HOST,
+            port=self.settings.DATABASE_PORT,
+            user=self.settings.DATABASE_USER,
+            password=self.settings.DATABASE_PASSWORD,
+            database=self.settings.DATABASE_CHARACTERS,
+            # Socket timeout for connect, and for every read on older connectors
+            connection_timeout=timeout,
+            **socket_timeouts,
+        )
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = self._create_pool()
+            return self._pool
+
+    def reset(self):
+        # Drop the pool, the next borrow builds a fresh one
+        with self._lock:
+            self._pool = None
+
+    def _get_connection(self):
+        from mysql.connector.errors import PoolError
+        # Every connection is borrowed: wait for one to come back rather than
+        # rebuilding the pool under the borrowers and going over its size
+        deadline = time.monotonic() + float(self.settings.DATABASE_TIMEOUT)
+        while True:
+            try:
+                return self._get_pool().get_connection()
+            except PoolError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(POOL_WAIT_INTERVAL)
+
+    def _borrow(self):
+        from mysql.connector import Error
+        from mysql.connector.errors import PoolError
+        try:
+            conn = self._get_connection()
+        except PoolError:
+            raise
+        except Error:
+            # Server went away, rebuild once and retry
+            self.reset()
+            conn = self._get_connection()
+
+        # Health check, transparently reconnects dead sockets
+        try:
+            conn.ping(reconnect=True, attempts=2, delay=0)
+        except Error:
+            conn.close()
+            self.reset()
+            raise
+        return conn
+
+    @contextmanager
+    def connection(self):
+        conn = self._borrow()
+        try:
+            yield conn
+        finally:
+            # Returns the connection to the pool
+            conn.close()
+
+    def fetchone(self, query, params=None):
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params)
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+
+    def fetchall(self, query, params=None):
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
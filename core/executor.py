@@ -0,0 +1,79 @@
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# How often the main thread picks up finished queries (ms)
+DISPATCH_INTERVAL = 50
+
+class QueryTimeout(Exception):
+    pass
+
+class QueryExecutor:
+    """Runs blocking calls on worker threads and hands results back to the main thread.
+
+    Callbacks are only ever invoked from dispatch(), which runs on the
+    scheduler's after() (the Tk root or a MainLoop), so they can safely touch widgets.
+    """
+
+    def __init__(self, scheduler, workers=2):
+        self._scheduler = scheduler
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="query")
+        self._results = queue.SimpleQueue()
+        self._pending = {}
+        self._scheduler.after(DISPATCH_INTERVAL, self.dispatch)
+
+    def submit(self, fn, callback=None, errback=None, timeout=None):
+        # After timeout seconds errback gets QueryTimeout, but a call already
+        # running cannot be stopped: its worker stays busy until fn returns.
+        # Database calls are bounded by the connector's own timeouts
+        # (DatabasePool), other blocking calls need one of their own.
+        deadline = time.monotonic() + timeout if timeout else None
+        future = self._pool.submit(fn)
+        self._pending[future] = (deadline, callback, errback)
+        future.add_done_callback(self._results.put)
+        return future
+
+    def post(self, fn):
+        # Run fn on the main thread during the next dispatch, callable from any thread
+        self._results.put(fn)
+
+    def _finish(self, future):
+        entry = self._pending.pop(future, None)
+        if entry is None:
+            return  # Already reported as timed out
+        _, callback, errback = entry
+
+        error = future.exception()
+        if error is None:
+            if callback:
+                callback(future.result())
+        elif errback:
+            errback(error)
+
+    def _expire(self):
+        now = time.monotonic()
+        for future, (deadline, _, errback) in list(self._pending.items()):
+            if deadline is None or now < deadline:
+                continue
+            # The worker keeps running but its late result is dropped, see submit()
+            future.cancel()
+            del self._pending[future]
+            if errback:
+                errback(QueryTimeout("query timed out"))
+
+    def dispatch(self):
+        try:
+            while True:
+                item = self._results.get_nowait()
+                if callable(item):
+                    item()
+                else:
+                    self._finish(item)
+        except queue.Empty:
+            pass
+        finally:
+            self._expire()
+            self._scheduler.after(DISPATCH_INTERVAL, self.dispatch)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,202 @@
+import datetime
+import mmap
+import os
+import re
+
+# Bytes between two entries of the sparse index
+INDEX_STRIDE = 1024 * 1024
+# Below this many bytes the lines are scanned instead of bisected
+SCAN_BYTES = 4096
+# "2024-05-01 12:34:56" or "2024-05-01_12:34:56" at the start of a line, as written by the AC appenders
+TIMESTAMP = re.compile(rb"(\d{4})-(\d\d)-(\d\d)[ _T](\d\d)[:-](\d\d)[:-](\d\d)")
+
+def parse_time(text):
+    """Datetime of a "YYYY-MM-DD HH:MM:SS" string, None when it is not one."""
+    match = TIMESTAMP.match(text.strip().encode())
+    if not match:
+        return None
+    try:
+        return datetime.datetime(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+class LogFile:
+    """Read-only, memory-mapped view of a log file of any size.
+
+    Nothing is read up front: lines are found by searching the map for
+    newlines around an offset, so opening costs the same for 5 KB and 5 GB
+    and memory use does not grow with the file. Jumping to a time uses a
+    sparse index of (line start, timestamp) every INDEX_STRIDE bytes, built
+    lazily by the binary search itself. The map covers the file as it was
+    when opened, reopen() picks up what was written since.
+    """
+
+    def __init__(self, path, stride=INDEX_STRIDE):
+        self.path = path
+        self.stride = stride
+        self.size = 0
+        self._file = None
+        self._map = None
+        self._index = {}
+
+    def open(self):
+        self.close()
+        self._file = open(self.path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # An empty file cannot be mapped
+        if self.size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index = {}
+        return self
+
+    def reopen(self):
+        return self.open()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.size = 0
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Lines ---
+
+    def line_start(self, offset):
+        """Start of the line that contains offset."""
+        if not self._map or offset <= 0:
+            return 0
+        offset = min(offset, self.size)
+        return self._map.rfind(b"\n", 0, offset) + 1
+
+    def next_line(self, offset):
+        """Start of the line after the one at offset, size at the last line."""
+        if not self._map:
+            return 0
+        end = self._map.find(b"\n", offset)
+        return self.size if end < 0 else end + 1
+
+    def previous_line(self, offset):
+        """Start of the line before the one at offset."""
+        start = self.line_start(offset)
+        return self.line_start(start - 1) if start else 0
+
+    def move(self, offset, count):
+        """Start of the line count lines after (or before, when negative) the one at offset."""
+        offset = self.line_start(offset)
+        step = self.next_line if count > 0 else self.previous_line
+        for _ in range(abs(count)):
+            moved = step(offset)
+            if moved >= self.size or moved == offset:
+                break
+            offset = moved
+        return offset
+
+    def read_line(self, offset):
+        """(text, next offset) of the line starting at offset."""
+        end = self.next_line(offset)
+        text = self._map[offset:end].decode("utf-8", errors="replace") if self._map else ""
+        return text.rstrip("\r\n"), end
+
+    def lines(self, offset, count):
+        """Up to count (offset, text) lines from the line at offset on."""
+        offset = self.line_start(offset)
+        lines = []
+        while len(lines) < count and offset < self.size:
+            text, end = self.read_line(offset)
+            lines.append((offset, text))
+            offset = end
+        return lines
+
+    def tail(self, count):
+        """Offset of the first of the last count lines."""
+        last = self.line_start(self.size - 1) if self.size else 0
+        return self.move(last, -(count - 1)) if count > 1 else last
+
+    # --- Timestamps ---
+
+    def timestamp(self, offset):
+        """Time of the line starting at offset, None when it has none."""
+        if not self._map:
+            return None
+        match = TIMESTAMP.match(self._map, offset, min(offset + 64, self.size))
+        if not match:
+            return None
+        try:
+            return datetime.datetime(*map(int, match.groups()))
+        except ValueError:
+            return None
+
+    def _sample(self, i):
+        # First timestamped line in stride i, continuation lines (stack traces) have none
+        if i not in self._index:
+            offset = self.line_start(i * self.stride) if i else 0
+            if i and offset < i * self.stride:
+                offset = self.next_line(offset)
+            end = min((i + 1) * self.stride, self.size)
+            found = None
+            while offset < end:
+                when = self.timestamp(offset)
+                if when is not None:
+                    found = (offset, when)
+                    break
+                offset = self.next_line(offset)
+            self._index[i] = found
+        return self._index[i]
+
+    def find_time(self, when):
+        """Offset of the first line logged at or after when, None if the file has no timestamps.
+
+        A binary search over the strides finds the last one that starts
+        before when, then its lines are scanned. Past the end of the log the
+        last line is returned.
+        """
+        if not self._map:
+            return None
+        strides = (self.size + self.stride - 1) // self.stride
+        lo, hi = 0, strides
+        start = None
+        while lo < hi:
+            mid = (lo + hi) // 2
+            sample = self._sample(mid)
+            if sample is None or sample[1] < when:
+                # Strides without any timestamp are treated as earlier
+                if sample is not None:
+                    start = sample[0]
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if start is None:
+            if self._sample(0) is None and self._sample(strides - 1) is None:
+                return None
+            start = 0
+
+        # Narrow the stride down by bytes as well, stamps are probed on the next full line
+        end = min(start + self.stride, self.size)
+        while end - start > SCAN_BYTES:
+            mid = self.next_line(self.line_start((start + end) // 2))
+            probe = mid
+            while probe < end and self.timestamp(probe) is None:
+                probe = self.next_line(probe)
+            if probe < end and self.timestamp(probe) < when:
+                start = probe
+            else:
+                end = mid
+
+        offset = start
+        last = start
+        while offset < self.size:
+            stamp = self.timestamp(offset)
+            if stamp is not None and stamp >= when:
+                return offset
+            last = offset
+            offset = self.next_line(offset)
+        return last
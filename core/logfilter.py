@@ -0,0 +1,124 @@
+import bisect
+import itertools
+import re
+
+# Severity tags and the words (lower case) that give a line that severity, the first one listed wins
+SEVERITIES = (
+    ("error", ("error", "fatal", "crash", "exception", "❗")),
+    ("sql", ("sql", "query")),
+    ("warning", ("warn", "⚠")),
+)
+# Text colour of every severity tag in the log widgets
+SEVERITY_COLORS = {
+    "error": "red",
+    "sql": "#8a2be2",
+    "warning": "#d2691e",
+}
+
+class LogFilter:
+    """Include/exclude rules and severity detection of one log tab.
+
+    Rules are compiled once and every rule is run over a whole batch of
+    lines joined into one string, so routine lines that no rule matches cost
+    no Python work at all: only hits are mapped back to their line, and a
+    hit running over a newline is checked again line by line. Each
+    severity word is its own plain pattern because Python's re only uses
+    its fast substring search for patterns starting with a literal, which a
+    single alternation of all words would lose. A line is kept when it
+    matches one of the include rules (or there are none) and none of the
+    excludes.
+    """
+
+    def __init__(self, include=(), exclude=(), severities=SEVERITIES):
+        self.include = [pattern for pattern in include if pattern]
+        self.exclude = [pattern for pattern in exclude if pattern]
+        # Raises re.error for a broken rule
+        self._include = [re.compile(pattern, re.MULTILINE) for pattern in self.include]
+        self._exclude = [re.compile(pattern, re.MULTILINE) for pattern in self.exclude]
+        self._severities = [
+            (rank, tag, re.compile(re.escape(word)), re.compile(re.escape(word), re.IGNORECASE))
+            for rank, (tag, words) in enumerate(severities)
+            for word in words
+        ]
+
+    @property
+    def active(self):
+        return bool(self.include or self.exclude)
+
+    def _hits(self, pattern, text, starts, lines):
+        # Line numbers with a match of pattern. A rule matching the empty
+        # string (".*", "^", "x*") also matches after the last newline, which
+        # is no line at all
+        count = len(lines)
+        hits = set()
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            first = bisect.bisect_right(starts, start) - 1
+            if text.find("\n", start, end) < 0:
+                if first < count:
+                    hits.add(first)
+                continue
+            # A match running over newlines ("\s+error", "[^z]+") says nothing
+            # about any one line, every line it covers is asked on its own
+            last = min(count - 1, bisect.bisect_right(starts, end - 1) - 1)
+            for line in range(first, last + 1):
+                if line not in hits and pattern.search(lines[line]):
+                    hits.add(line)
+        return hits
+
+    def apply(self, lines):
+        """Tk insert arguments (text, tags, text, tags, ...) of the kept lines and how many were kept.
+
+        lines have no newlines. Runs of untagged lines stay one slice of the
+        joined batch, so a whole batch or the history of a tab goes into the
+        widget with one insert.
+        """
+        lines = list(lines)
+        if not lines:
+            return [], 0
+        text = "\n".join(lines) + "\n"
+        # Offset of every line in text, computed without a Python loop
+        starts = [0]
+        starts += itertools.accumulate(map((1).__add__, map(len, lines)))
+
+        # Lower case once for the severity words, unless that changes offsets
+        lowered = text.lower()
+        exact = len(lowered) == len(text)
+
+        tags = {}
+        for rank, tag, word, any_case in self._severities:
+            for line in self._hits(word, lowered, starts, lines) if exact else self._hits(any_case, text, starts, lines):
+                if line not in tags or tags[line][0] > rank:
+                    tags[line] = (rank, tag)
+
+        excluded = set()
+        for pattern in self._exclude:
+            excluded |= self._hits(pattern, text, starts, lines)
+
+        if self._include:
+            kept = set()
+            for pattern in self._include:
+                kept |= self._hits(pattern, text, starts, lines)
+            kept -= excluded
+            chunks = []
+            for line in sorted(kept):
+                tag = tags.get(line)
+                chunks += [lines[line] + "\n", (tag[1],) if tag else ()]
+            return chunks, len(kept)
+
+        # Everything but the excluded lines, plain runs in between tagged lines
+        chunks = []
+        kept = 0
+        position = 0
+        for line in sorted(excluded | set(tags)):
+            if position < line:
+                chunks += [text[starts[position]:starts[line]], ()]
+                kept += line - position
+            position = line + 1
+            if line not in excluded:
+                chunks += [lines[line] + "\n", (tags[line][1],)]
+                kept += 1
+        if position < len(lines):
+            chunks += [text[starts[position]:], ()]
+            kept += len(lines) - position
+        return chunks, kept
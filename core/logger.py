@@ -1,22 +1,202 @@
+import collections
+import os
+import queue
+import time
 import tkinter as tk
+from core.logfilter import SEVERITY_COLORS, LogFilter
+from core.loghistory import LogHistory
+from core.logstorm import StormGuard
+
+# How often the main thread drains pending lines (ms)
+DRAIN_INTERVAL = 50
+# Upper bound of lines handled per drain so one frame never stalls the UI
+MAX_LINES_PER_DRAIN = 5000
+# Let a pane overshoot its cap by this fraction so trimming happens in bulk
+TRIM_SLACK = 0.1
+# Unfiltered lines kept for re-filtering a pane without a cap
+UNCAPPED_HISTORY = 20000
+# Lines per second a single source may put on screen, 0 = no limit
+LINE_RATE = 2000
+
+class Pane:
+    """A log widget capped to max_lines, spilling older lines to disk.
+
+    The last max_lines lines are also kept unfiltered, so a new filter can
+    redraw the pane from them; lines leaving that history are spilled,
+    whether the filter showed them or not.
+    """
+
+    def __init__(self, widget: tk.Text, max_lines: int, spill_path: str):
+        self.widget = widget
+        self.max_lines = max_lines
+        self.spill_path = spill_path
+        self.line_count = 0
+        self.filter = LogFilter()
+        self.history = collections.deque()
+        self.history_size = max_lines if max_lines > 0 else UNCAPPED_HISTORY
+
+        for tag, color in SEVERITY_COLORS.items():
+            widget.tag_configure(tag, foreground=color)
+
+    def remember(self, lines):
+        self.history.extend(lines)
+        excess = len(self.history) - self.history_size
+        if excess > 0:
+            spilled = [self.history.popleft() for _ in range(excess)]
+            if self.max_lines > 0:
+                self._spill("\n".join(spilled) + "\n")
+
+    def trim(self):
+        if self.max_lines <= 0:
+            return
+        if self.line_count <= self.max_lines * (1 + TRIM_SLACK):
+            return
+
+        excess = self.line_count - self.max_lines
+        self.widget.delete("1.0", f"{excess + 1}.0")
+        self.line_count -= excess
+
+    def _spill(self, text: str):
+        if not self.spill_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+            with open(self.spill_path, 'a', encoding='utf-8') as f:
+                f.write(text)
+        except OSError:
+            pass  # Never let a full disk take the UI down
 
 class Logger:
-    def __init__(self, manager_widget: tk.Text, auth_widget: tk.Text, world_widget: tk.Text):
-        self._manager_log = manager_widget
-        self._auth_log = auth_widget
-        self._world_log = world_widget
+    """Routes log text by source ("manager", "main.world", ...) to its Text pane."""
+
+    def __init__(self, root: tk.Misc, spill_dir: str = "logs", line_rate=LINE_RATE):
+        self._root = root
+        self._spill_dir = spill_dir
+        self._panes = {}
+
+        # Log storms are folded and rate limited per source before they reach a widget
+        self.line_rate = float(line_rate or 0)
+        self._guards = {}
+
+        # Lines are produced by reader threads and consumed on the Tk main thread
+        self._queue = queue.SimpleQueue()
+
+        # Recent lines of every source, read by the control API
+        self.history = LogHistory()
+
+        self._lines_in_window = 0
+        self._window_start = time.monotonic()
+        self.lines_per_second = 0.0
+
+        self._root.after(DRAIN_INTERVAL, self._drain)
+
+    def add_pane(self, source: str, widget: tk.Text, max_lines=0):
+        spill_path = os.path.join(self._spill_dir, f"{source}.log") if self._spill_dir else None
+        self._panes[source] = Pane(widget, int(max_lines), spill_path)
+
+    def write(self, source: str, text: str):
+        # Safe to call from any thread, the widget is only touched by _drain
+        self._queue.put((source, text))
+
+    def _pane(self, source: str):
+        return self._panes.get(source) or self._panes["manager"]
+
+    def _insert(self, source: str, lines):
+        pane = self._pane(source)
+        chunks, kept = pane.filter.apply(lines)
+        if not kept:
+            return
+        pane.line_count += kept
+        widget = pane.widget
 
-    def _append_text(self, widget: tk.Text, text: str):
         widget.config(state='normal')
-        widget.insert(tk.END, text)
+        widget.insert(tk.END, *chunks)
+        pane.trim()
         widget.config(state='disabled')
         widget.see(tk.END)
 
-    def manager(self, text: str):
-        self._append_text(self._manager_log, text)
+    def set_filter(self, source: str, include=(), exclude=()):
+        """Filter a pane from now on and redraw it from its history. Raises re.error for a bad rule."""
+        pane = self._panes[source]
+        # Only installed once it worked on the history, a failing rule leaves the old filter
+        log_filter = LogFilter(include, exclude)
+
+        # One pass over the history and one insert, however many lines it holds
+        chunks, kept = log_filter.apply(pane.history)
+        pane.filter = log_filter
+        widget = pane.widget
+        widget.config(state='normal')
+        widget.delete("1.0", tk.END)
+        if chunks:
+            widget.insert(tk.END, *chunks)
+        pane.line_count = kept
+        widget.config(state='disabled')
+        widget.see(tk.END)
 
-    def auth(self, text: str):
-        self._append_text(self._auth_log, text)
+    def _drain(self):
+        pending = {}
+        count = 0
+        try:
+            while count < MAX_LINES_PER_DRAIN:
+                source, text = self._queue.get_nowait()
+                pending.setdefault(source, []).append(text)
+                count += 1
+        except queue.Empty:
+            pass
 
-    def world(self, text: str):
-        self._append_text(self._world_log, text)
+        # Always scheduled again, one failing batch must not stop the log tabs for good
+        try:
+            # One insert per pane per frame
+            now = time.monotonic()
+            for source, texts in pending.items():
+                text = "".join(texts)
+                self.history.append(source, text)
+                lines = text.split("\n")
+                if lines[-1] == "":
+                    lines.pop()
+                self._show(source, lines, now)
+
+            # A storm that just stopped still owes its "repeated N times" lines
+            for source, guard in self._guards.items():
+                if source not in pending and guard.pending:
+                    self._show(source, [], now)
+
+            self._update_rate(count)
+        finally:
+            self._root.after(DRAIN_INTERVAL, self._drain)
+
+    def _show(self, source, lines, now):
+        guard = self._guards.get(source)
+        if guard is None:
+            guard = self._guards[source] = StormGuard(self.line_rate)
+        # The history keeps every line, so a new filter still finds what the guard folded
+        self._pane(source).remember(lines)
+        lines = guard.admit(lines, now)
+        if not lines:
+            return
+        try:
+            self._insert(source, lines)
+        except tk.TclError:
+            pass  # Widget destroyed while closing
+
+    def _update_rate(self, count):
+        self._lines_in_window += count
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.lines_per_second = self._lines_in_window / elapsed
+            self._lines_in_window = 0
+            self._window_start = now
+
+    def queue_depth(self):
+        return self._queue.qsize()
+
+    def stats(self):
+        return {
+            "lines_per_second": round(self.lines_per_second, 1),
+            "queue_depth": self.queue_depth(),
+            "lines_suppressed": sum(guard.suppressed for guard in self._guards.values()),
+        }
+
+    def manager(self, text: str):
+        self.write("manager", text)
@@ -0,0 +1,54 @@
+import collections
+import itertools
+import threading
+import time
+
+# Lines kept for the control API across all sources
+HISTORY_LINES = 20000
+
+class LogHistory:
+    """The most recent log lines of every source, numbered for cursor paging.
+
+    Every line gets the next sequence number, a cursor is the number of the
+    first line a reader has not seen yet. Safe to use from any thread.
+    """
+
+    def __init__(self, max_lines=HISTORY_LINES):
+        self._lines = collections.deque(maxlen=max_lines)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def append(self, source, text):
+        now = time.time()
+        with self._lock:
+            for line in text.splitlines():
+                self._lines.append((self._next, now, source, line))
+                self._next += 1
+
+    @property
+    def cursor(self):
+        return self._next
+
+    def read(self, cursor=None, limit=100, source=None):
+        """Return (lines, next cursor, oldest kept) of (seq, time, source, text) tuples.
+
+        Without a cursor the newest limit lines are returned, otherwise the
+        oldest lines at or after cursor. Lines already dropped are skipped.
+        """
+        with self._lock:
+            oldest = self._next - len(self._lines)
+            if cursor is None:
+                lines = [line for line in reversed(self._lines) if source is None or line[2] == source]
+                lines = lines[:limit][::-1]
+                return lines, self._next, oldest
+
+            start = min(max(cursor, oldest), self._next)
+            lines = []
+            next_cursor = start
+            for line in itertools.islice(self._lines, start - oldest, None):
+                next_cursor = line[0] + 1
+                if source is None or line[2] == source:
+                    lines.append(line)
+                    if len(lines) >= limit:
+                        break
+            return lines, next_cursor, oldest
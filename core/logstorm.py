@@ -0,0 +1,113 @@
+import re
+import time
+
+# Seconds after which repeats are summed up and counting starts over
+COALESCE_WINDOW = 1.0
+# Copies of a line shown per window before the rest are folded
+SHOW_REPEATS = 3
+# Distinct lines counted per window, lines beyond are never folded
+MAX_TRACKED = 512
+# Lines a burst may put on screen at once, in seconds of the rate
+BURST_SECONDS = 2
+
+# The same line logged at different times is still the same line
+LEADING_TIME = re.compile(r"\d{4}-\d\d-\d\d[ _T]\d\d[:-]\d\d[:-]\d\d\s*")
+
+class TokenBucket:
+    """rate tokens per second, up to capacity saved for bursts."""
+
+    def __init__(self, rate, capacity=None, now=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else self.rate)
+        self.tokens = self.capacity
+        self._last = now if now is not None else time.monotonic()
+
+    def take(self, count, now=None):
+        """Take up to count tokens, returns how many were granted."""
+        now = now if now is not None else time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+        granted = min(count, int(self.tokens))
+        self.tokens -= granted
+        return granted
+
+class StormGuard:
+    """Keeps one log source from flooding its widget.
+
+    A line repeated more than SHOW_REPEATS times within COALESCE_WINDOW is
+    folded, its copies are counted and shown as one "repeated N more times"
+    line when the window ends. What is left passes a token bucket of rate
+    lines per second (0 = no limit); lines over the limit are counted and
+    reported the same way, newest lines win. Only the display is affected:
+    the Logger's history and the on-disk capture get every line.
+    """
+
+    def __init__(self, rate, window=COALESCE_WINDOW, show_repeats=SHOW_REPEATS, max_tracked=MAX_TRACKED):
+        self.rate = float(rate)
+        self.window = window
+        self.show_repeats = show_repeats
+        self.max_tracked = max_tracked
+        self.bucket = TokenBucket(self.rate, self.rate * BURST_SECONDS) if self.rate > 0 else None
+        self.suppressed = 0
+
+        # Line (without its time) -> [times seen this window, last copy]
+        self._seen = {}
+        self._window_start = None
+        self._dropped = 0
+
+    @property
+    def pending(self):
+        # Summaries still to be shown once the window ends
+        return self._window_start is not None
+
+    def admit(self, lines, now=None):
+        """The lines to show out of lines, with summaries of the previous window first."""
+        now = now if now is not None else time.monotonic()
+        shown = []
+        if self._window_start is not None and now - self._window_start >= self.window:
+            shown = self.summaries()
+        if not lines:
+            return shown
+        if self._window_start is None:
+            self._window_start = now
+
+        seen = self._seen
+        kept = []
+        for line in lines:
+            if not line.strip():
+                kept.append(line)
+                continue
+            match = LEADING_TIME.match(line)
+            key = line[match.end():] if match else line
+            entry = seen.get(key)
+            if entry is None:
+                if len(seen) < self.max_tracked:
+                    seen[key] = [1, line]
+                kept.append(line)
+            else:
+                entry[0] += 1
+                entry[1] = line
+                if entry[0] <= self.show_repeats:
+                    kept.append(line)
+        self.suppressed += len(lines) - len(kept)
+
+        if self.bucket:
+            granted = self.bucket.take(len(kept), now)
+            if granted < len(kept):
+                self._dropped += len(kept) - granted
+                self.suppressed += len(kept) - granted
+                kept = kept[len(kept) - granted:] if granted else []
+        return shown + kept
+
+    def summaries(self):
+        """End the window, one line per folded line and one for the rate limit."""
+        lines = []
+        for count, last in self._seen.values():
+            if count > self.show_repeats:
+                lines.append(f"{last} (repeated {count - self.show_repeats} more times)")
+        if self._dropped:
+            lines.append(f"⚠️ {self._dropped} lines not shown, more than {self.rate:g} lines/s.")
+        self._seen = {}
+        self._dropped = 0
+        self._window_start = None
+        return lines
@@ -0,0 +1,58 @@
+import heapq
+import itertools
+import queue
+import time
+import traceback
+
+class MainLoop:
+    """Minimal stand-in for the Tk event loop used by the headless daemon.
+
+    Offers the same after(ms, fn) the core modules expect from the Tk root,
+    without a display or any GUI dependency. Timers run on the thread that
+    calls run(); post() may be used from any thread.
+    """
+
+    def __init__(self):
+        self._timers = []
+        self._counter = itertools.count()
+        self._inbox = queue.SimpleQueue()
+        self._running = False
+
+    def after(self, ms, fn):
+        # Routed through the inbox so it is safe from any thread
+        self._inbox.put((time.monotonic() + ms / 1000, fn))
+
+    def post(self, fn):
+        self.after(0, fn)
+
+    def stop(self):
+        self._running = False
+        self._inbox.put(None)
+
+    def run(self):
+        self._running = True
+        while self._running:
+            timeout = None
+            if self._timers:
+                timeout = max(0.0, self._timers[0][0] - time.monotonic())
+
+            try:
+                item = self._inbox.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            while item is not None:
+                when, fn = item
+                heapq.heappush(self._timers, (when, next(self._counter), fn))
+                try:
+                    item = self._inbox.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            now = time.monotonic()
+            while self._running and self._timers and self._timers[0][0] <= now:
+                _, _, fn = heapq.heappop(self._timers)
+                try:
+                    fn()
+                except Exception:
+                    # Same as Tk: report the callback error and keep running
+                    traceback.print_exc()
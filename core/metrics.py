@@ -0,0 +1,222 @@
+import array
+import bisect
+import os
+import struct
+import threading
+import time
+
+# (name, bucket seconds, capacity): raw samples and 1-minute/1-hour averages
+TIERS = (
+    ("raw", 0, 1200),
+    ("minute", 60, 1440),
+    ("hour", 3600, 24 * 90),
+)
+TIER_NAMES = [name for name, _, _ in TIERS]
+
+FILE_MAGIC = b"ACMETRC1"
+# Record kinds in the append-only file
+NAME_RECORD = 0
+SAMPLE_RECORD = 1
+NAME_HEADER = struct.Struct("<BHH")   # kind, series id, name length
+SAMPLE = struct.Struct("<BBHdd")      # kind, tier, series id, timestamp, value
+# Rewrite the file from memory once it grows past this size
+MAX_FILE_SIZE = 32 * 1024 * 1024
+
+class RingBuffer:
+    """Fixed capacity (timestamp, value) buffer backed by two arrays of doubles."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.times = array.array('d', bytes(8 * capacity))
+        self.values = array.array('d', bytes(8 * capacity))
+        self.count = 0
+        self._next = 0
+
+    def append(self, timestamp, value):
+        self.times[self._next] = timestamp
+        self.values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _ordered(self, data):
+        start = (self._next - self.count) % self.capacity
+        if start + self.count <= self.capacity:
+            return data[start:start + self.count]
+        return data[start:] + data[:self._next]
+
+    def items(self):
+        """Return (times, values) oldest first."""
+        return self._ordered(self.times), self._ordered(self.values)
+
+class Series:
+    """One metric with a ring per tier, raw samples are averaged into the coarser tiers."""
+
+    def __init__(self, name, series_id):
+        self.name = name
+        self.id = series_id
+        self.rings = [RingBuffer(capacity) for _, _, capacity in TIERS]
+        # [bucket start, sum, count] of the bucket being filled, per tier
+        self._buckets = [None] * len(TIERS)
+
+    def add(self, timestamp, value):
+        """Add a raw sample, returns the (tier, timestamp, value) points it completed."""
+        points = [(0, timestamp, value)]
+        self.rings[0].append(timestamp, value)
+
+        for tier in range(1, len(TIERS)):
+            seconds = TIERS[tier][1]
+            start = timestamp - timestamp % seconds
+            bucket = self._buckets[tier]
+            if bucket and bucket[0] != start:
+                average = bucket[1] / bucket[2]
+                self.rings[tier].append(bucket[0], average)
+                points.append((tier, bucket[0], average))
+                bucket = None
+            if bucket is None:
+                bucket = self._buckets[tier] = [start, 0.0, 0]
+            bucket[1] += value
+            bucket[2] += 1
+        return points
+
+class MetricsStore:
+    """In-memory metric history persisted to an append-only binary file.
+
+    Safe to use from several threads: the resource sampler records from its
+    own thread while stats are recorded on the scheduler thread.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.series = {}
+        self._lock = threading.Lock()
+        self._pending = bytearray()
+        self._file = None
+        self._size = 0
+
+    def open(self):
+        with self._lock:
+            self._load()
+            if self._size > MAX_FILE_SIZE:
+                self._compact()
+            else:
+                self._open_file()
+
+    def _open_file(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, 'ab')
+        if self._file.tell() == 0:
+            self._file.write(FILE_MAGIC)
+        self._size = self._file.tell()
+
+    def _load(self):
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        if not data.startswith(FILE_MAGIC):
+            # Not ours, keep it aside instead of appending to it
+            os.replace(self.path, self.path + ".bad")
+            return
+
+        by_id = {}
+        offset = len(FILE_MAGIC)
+        while offset < len(data):
+            kind = data[offset]
+            if kind == NAME_RECORD:
+                if offset + NAME_HEADER.size > len(data):
+                    break
+                _, series_id, length = NAME_HEADER.unpack_from(data, offset)
+                end = offset + NAME_HEADER.size + length
+                if end > len(data):
+                    break
+                name = data[offset + NAME_HEADER.size:end].decode('utf-8')
+                by_id[series_id] = self.series[name] = Series(name, series_id)
+                offset = end
+            elif kind == SAMPLE_RECORD:
+                if offset + SAMPLE.size > len(data):
+                    break
+                _, tier, series_id, timestamp, value = SAMPLE.unpack_from(data, offset)
+                series = by_id.get(series_id)
+                if series and tier < len(TIERS):
+                    series.rings[tier].append(timestamp, value)
+                offset += SAMPLE.size
+            else:
+                break
+
+        # A torn record from an unclean exit is cut off before appending again
+        if offset < len(data):
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+        self._size = offset
+
+    def _name_record(self, series):
+        encoded = series.name.encode('utf-8')
+        return NAME_HEADER.pack(NAME_RECORD, series.id, len(encoded)) + encoded
+
+    def _series(self, name):
+        series = self.series.get(name)
+        if series is None:
+            series = self.series[name] = Series(name, len(self.series))
+            self._pending += self._name_record(series)
+        return series
+
+    def record(self, values, timestamp=None):
+        """Record {series name: value} taken at timestamp (now by default)."""
+        timestamp = timestamp if timestamp is not None else time.time()
+        with self._lock:
+            for name, value in values.items():
+                series = self._series(name)
+                for tier, point_time, point_value in series.add(timestamp, float(value)):
+                    self._pending += SAMPLE.pack(SAMPLE_RECORD, tier, series.id, point_time, point_value)
+
+    def flush(self):
+        with self._lock:
+            if not self._pending or self._file is None:
+                return
+            try:
+                self._file.write(self._pending)
+                self._file.flush()
+                self._size += len(self._pending)
+            except OSError:
+                pass  # Never let a full disk take the supervisor down
+            self._pending.clear()
+            if self._size > MAX_FILE_SIZE:
+                self._compact()
+
+    def _compact(self):
+        # Rewrite only what is still in memory, the rings bound the file size
+        if self._file:
+            self._file.close()
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(FILE_MAGIC)
+            for series in self.series.values():
+                f.write(self._name_record(series))
+            for series in self.series.values():
+                for tier, ring in enumerate(series.rings):
+                    times, values = ring.items()
+                    f.write(b"".join(
+                        SAMPLE.pack(SAMPLE_RECORD, tier, series.id, t, v) for t, v in zip(times, values)
+                    ))
+        os.replace(temp_path, self.path)
+        self._open_file()
+
+    def history(self, name, tier="raw", since=None):
+        """Return (times, values) of a series for one tier, oldest first."""
+        with self._lock:
+            series = self.series.get(name)
+            if series is None:
+                return [], []
+            times, values = series.rings[TIER_NAMES.index(tier)].items()
+        if since is not None:
+            first = bisect.bisect_left(times, since)
+            times, values = times[first:], values[first:]
+        return times, values
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+
+# psutil is imported on first use, it is not needed to show the window
+
+# Seconds between full process table scans for servers we did not start
+RESCAN_INTERVAL = 60
+
+def _normalize(path):
+    return os.path.normcase(os.path.abspath(path)) if path else None
+
+class ProcessRegistry:
+    """Tracks server processes by PID so "is it running" does not scan the process table.
+
+    Every server is tracked under a key (e.g. "main.world") together with its
+    executable path, which is what tells realms apart on a shared host.
+    Processes spawned by the manager are registered with their Popen handle.
+    Servers started outside the manager are picked up by an occasional full
+    scan and then followed by PID and create time, which guards against PID reuse.
+    """
+
+    def __init__(self, rescan_interval=RESCAN_INTERVAL):
+        self.rescan_interval = rescan_interval
+        self._targets = {}
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._last_scan = 0.0
+
+    def track(self, key, exe_path):
+        self._targets[key] = _normalize(exe_path)
+
+    def register(self, key, popen):
+        import psutil
+        try:
+            create_time = psutil.Process(popen.pid).create_time()
+        except psutil.Error:
+            create_time = None
+        with self._lock:
+            self._entries[key] = (popen.pid, create_time, popen)
+
+    def _match(self, info, by_path, by_name):
+        exe = _normalize(info['exe'])
+        if exe:
+            return by_path.get(exe)
+        # No access to the executable path, fall back to an unambiguous name
+        return by_name.get(info['name'])
+
+    def discover(self):
+        by_path = {}
+        names = {}
+        for key, path in self._targets.items():
+            if path:
+                by_path.setdefault(path, key)
+                names.setdefault(os.path.basename(path), []).append(key)
+        by_name = {name: keys[0] for name, keys in names.items() if len(keys) == 1}
+
+        import psutil
+
+        found = {}
+        for proc in psutil.process_iter(['name', 'exe', 'pid', 'create_time']):
+            key = self._match(proc.info, by_path, by_name)
+            if key and key not in found:
+                found[key] = (proc.info['pid'], proc.info['create_time'], None)
+
+        with self._lock:
+            for key, entry in found.items():
+                # Keep our own Popen handles, they are the better source
+                if not self._alive(self._entries.get(key)):
+                    self._entries[key] = entry
+            self._last_scan = time.monotonic()
+
+    def _alive(self, entry):
+        if entry is None:
+            return False
+        pid, create_time, popen = entry
+        if popen is not None:
+            return popen.poll() is None
+        import psutil
+        try:
+            return psutil.Process(pid).create_time() == create_time
+        except psutil.Error:
+            return False
+
+    def is_running(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if self._alive(entry):
+                return True
+            self._entries.pop(key, None)
+            rescan = time.monotonic() - self._last_scan >= self.rescan_interval
+
+        if rescan:
+            self.discover()
+            with self._lock:
+                return key in self._entries
+        return False
+
+    def pid(self, key):
+        if not self.is_running(key):
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry else None
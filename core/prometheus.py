@@ -0,0 +1,91 @@
+# Prometheus text exposition format (version 0.0.4) of a StateCache snapshot
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+class _Family:
+    def __init__(self, name, kind, help):
+        self.name = name
+        self.kind = kind
+        self.help = help
+        self.samples = []
+
+    def add(self, value, suffix="", **labels):
+        if value is not None:
+            self.samples.append((suffix, labels, value))
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples:
+            lines.append(f"{self.name}{suffix}{_labels(labels)} {float(value)!r}")
+        return lines
+
+def render(snapshot):
+    """Return the exposition text for a snapshot built by StateCache.update()."""
+    up = _Family("acore_server_up", "gauge", "1 while the server process is running.")
+    cpu = _Family("acore_server_cpu_percent", "gauge", "Server CPU usage, normalized to all cores.")
+    rss = _Family("acore_server_resident_memory_bytes", "gauge", "Server resident set size.")
+    online = _Family("acore_players_online", "gauge", "Characters online.")
+    gms = _Family("acore_gms_online", "gauge", "Game masters online.")
+    tickets = _Family("acore_tickets_open", "gauge", "Open GM tickets.")
+    restarts = _Family("acore_worldserver_restarts_total", "counter", "Worldserver restarts done by the manager.")
+    crashes = _Family("acore_worldserver_crashes_total", "counter", "Worldserver exits with the crash exit code.")
+    ready = _Family("acore_worldserver_ready", "gauge", "1 once the worldserver console is up.")
+    crash_loop = _Family("acore_worldserver_crash_loop", "gauge", "1 while automatic restarts are paused by the crash-loop breaker.")
+    time_to_ready = _Family("acore_worldserver_last_time_to_ready_seconds", "gauge", "Exit to world ready of the latest automatic restart.")
+    downtime = _Family("acore_worldserver_restart_downtime_seconds_total", "counter", "Exit to world ready, summed over automatic restarts.")
+    commands = _Family("acore_console_commands_outstanding", "gauge", "Console commands waiting for their reply.")
+
+    for realm in snapshot["realms"]:
+        for server in ("world", "auth"):
+            info = realm[server]
+            if info is None:
+                continue
+            labels = {"realm": realm["id"], "server": server}
+            up.add(1 if info["running"] else 0, **labels)
+            cpu.add(info["cpu"], **labels)
+            rss.add(info["memory_mb"] * 1024 * 1024, **labels)
+
+        players = realm["players"]
+        if players:
+            online.add(players["online"], realm=realm["id"])
+            gms.add(players["gms"], realm=realm["id"])
+            tickets.add(players["tickets"], realm=realm["id"])
+        restarts.add(realm["restarts"], realm=realm["id"])
+        crashes.add(realm["crashes"], realm=realm["id"])
+        ready.add(1 if realm["world_ready"] else 0, realm=realm["id"])
+        crash_loop.add(1 if realm["crash_loop"] else 0, realm=realm["id"])
+        time_to_ready.add(realm["last_time_to_ready"], realm=realm["id"])
+        downtime.add(realm["downtime_seconds"], realm=realm["id"])
+        commands.add(realm["commands_outstanding"], realm=realm["id"])
+
+    log = snapshot["log"]
+    log_rate = _Family("acore_log_lines_per_second", "gauge", "Log lines received per second, all sources.")
+    log_rate.add(log["lines_per_second"])
+    log_queue = _Family("acore_log_queue_depth", "gauge", "Log lines waiting to be shown.")
+    log_queue.add(log["queue_depth"])
+    log_suppressed = _Family("acore_log_lines_suppressed_total", "counter", "Repeated or rate limited log lines not shown in the UI.")
+    log_suppressed.add(log["lines_suppressed"])
+
+    database = snapshot["database"]
+    query = _Family("acore_db_stats_query_duration_seconds", "summary", "Round trip of the stats query.")
+    query.add(database["query_seconds"], "_sum")
+    query.add(database["queries"], "_count")
+    last_query = _Family("acore_db_stats_query_last_seconds", "gauge", "Round trip of the latest stats query.")
+    last_query.add(database["last_query_seconds"])
+
+    lines = []
+    families = (
+        up, cpu, rss, online, gms, tickets, restarts, crashes, ready, crash_loop, time_to_ready, downtime,
+        commands, log_rate, log_queue, log_suppressed, query, last_query,
+    )
+    for family in families:
+        lines.extend(family.render())
+    return "\n".join(lines) + "\n"
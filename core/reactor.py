@@ -0,0 +1,194 @@
+import asyncio
+import codecs
+import locale
+import subprocess
+import sys
+import threading
+
+# Bytes read from a child pipe per read() call
+PIPE_CHUNK_SIZE = 64 * 1024
+
+# Servers must not share our console, so Ctrl+C on the manager never reaches them
+if sys.platform == "win32":
+    SERVER_SPAWN_OPTIONS = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NO_WINDOW}
+else:
+    SERVER_SPAWN_OPTIONS = {"start_new_session": True}
+
+class ServerProcess:
+    """Handle to a child started by the Reactor, usable from any thread."""
+
+    def __init__(self, reactor, process):
+        self._reactor = reactor
+        self._process = process
+        self.pid = process.pid
+        self.done = None
+
+    @property
+    def returncode(self):
+        return self._process.returncode
+
+    def poll(self):
+        return self._process.returncode
+
+    def write(self, text):
+        stdin = self._process.stdin
+        if stdin is None:
+            raise OSError("stdin is not available")
+        data = text.encode(self._reactor.encoding)
+        self._reactor.loop.call_soon_threadsafe(stdin.write, data)
+
+    def terminate(self):
+        if self._process.returncode is None:
+            self._reactor.loop.call_soon_threadsafe(self._terminate)
+
+    def _terminate(self):
+        try:
+            self._process.terminate()
+        except ProcessLookupError:
+            pass
+
+class Reactor:
+    """Single asyncio loop multiplexing child pipes, log tails and exit watchers.
+
+    Everything runs as tasks on one thread, so the number of threads stays the
+    same no matter how many servers are managed or how often they restart.
+    Callbacks (on_line, on_exit) are invoked on the reactor thread and must not
+    block; hand work that touches Tk over to the main thread.
+    """
+
+    def __init__(self):
+        if sys.platform == "win32":
+            # Pipes and subprocesses need the proactor on Windows
+            self.loop = asyncio.ProactorEventLoop()
+        else:
+            self.loop = asyncio.new_event_loop()
+        self.encoding = locale.getpreferredencoding(False)
+        self._thread = threading.Thread(target=self._run, name="reactor", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def stop(self):
+        if self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+
+    async def _shutdown(self):
+        # Cancel readers, exit watchers and tails so nothing is left dangling
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.loop.stop()
+
+    def _call(self, coro):
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("blocking reactor call from the reactor thread")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    # --- Child processes ---
+
+    def spawn(self, args, cwd, on_line, on_exit=None, stdin=False, prompt=None):
+        """Start a child and stream its stdout/stderr lines to on_line.
+
+        Output ending in prompt is passed on without waiting for a newline.
+        """
+        return self._call(self._spawn(args, cwd, on_line, on_exit, stdin, prompt))
+
+    async def _spawn(self, args, cwd, on_line, on_exit, stdin, prompt):
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            stdin=asyncio.subprocess.PIPE if stdin else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **SERVER_SPAWN_OPTIONS,
+        )
+        handle = ServerProcess(self, process)
+        readers = [
+            self.loop.create_task(self._read_pipe(process.stdout, on_line, prompt)),
+            self.loop.create_task(self._read_pipe(process.stderr, on_line, prompt)),
+        ]
+        handle.done = self.loop.create_task(self._watch_exit(process, readers, on_exit))
+        return handle
+
+    async def _read_pipe(self, stream, on_line, prompt=None):
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        partial = ""
+        while True:
+            chunk = await stream.read(PIPE_CHUNK_SIZE)
+            if not chunk:
+                break
+            lines = (partial + decoder.decode(chunk)).split("\n")
+            partial = lines.pop()
+            for line in lines:
+                on_line(line.rstrip("\r") + "\n")
+            if prompt and partial.rstrip().endswith(prompt):
+                # A console prompt is never followed by a newline
+                on_line(partial + "\n")
+                partial = ""
+        partial += decoder.decode(b"", final=True)
+        if partial:
+            on_line(partial + "\n")
+
+    async def _watch_exit(self, process, readers, on_exit):
+        exit_code = await process.wait()
+        # Let the readers flush the last output before reporting the exit
+        await asyncio.gather(*readers, return_exceptions=True)
+        if on_exit:
+            on_exit(exit_code)
+        return exit_code
+
+    # --- Servers ---
+
+    def start_server(self, on_client, host=None, port=None, path=None):
+        """Listen on host:port, or on the Unix socket path, for on_client(reader, writer)."""
+        return self._call(self._start_server(on_client, host, port, path))
+
+    async def _start_server(self, on_client, host, port, path):
+        if path:
+            return await asyncio.start_unix_server(on_client, path=path)
+        return await asyncio.start_server(on_client, host=host, port=port)
+
+    def close_server(self, server):
+        self.loop.call_soon_threadsafe(server.close)
+
+    # --- Log files ---
+
+    def tail(self, tailer):
+        """Drive a LogTailer from the loop until tailer.stop() is called."""
+        self.loop.call_soon_threadsafe(self.loop.create_task, self._tail(tailer))
+        return tailer
+
+    async def _tail(self, tailer):
+        wake = asyncio.Event()
+        watch = tailer.open_watch()
+        watched = []
+        if watch is not None:
+            # Filesystem events and the stop pipe both wake the tail up
+            for fd in (watch.fileno(), tailer.wake_fileno()):
+                self.loop.add_reader(fd, wake.set)
+                watched.append(fd)
+        try:
+            changed = True
+            while not tailer.stopped:
+                if changed:
+                    tailer.poll()
+                timed_out = False
+                try:
+                    await asyncio.wait_for(wake.wait(), tailer.poll_interval)
+                except asyncio.TimeoutError:
+                    timed_out = True
+                wake.clear()
+                # Events for other files in the same directory do not cost a read
+                changed = timed_out or watch is None or watch.drain()
+        except Exception as e:
+            tailer.report(f"❗ General error tailing log file {tailer.filepath}: {e}\n")
+        finally:
+            for fd in watched:
+                self.loop.remove_reader(fd)
+            tailer.close()
@@ -0,0 +1,337 @@
+import collections
+import datetime
+import os
+import time
+from core.bootprofile import BootProfiler
+from core.commands import PROMPT, CommandChannel, ServerNotRunning
+from core.restart import EXIT_CRASH, EXIT_RESTART, Downtime, RestartPolicy
+from core.tailer import LogTailer
+
+# Logged by the worldserver once it accepts players, e.g. "AzerothCore rev. ... (worldserver-daemon) ready..."
+WORLD_READY = "(worldserver-daemon) ready"
+# Restarts kept in memory for the status views
+DOWNTIME_HISTORY = 50
+# Wait after world ready before closing the boot profile, the log tail may lag (ms)
+BOOT_SETTLE = 2000
+
+def phase_text(phase):
+    text = f"{phase['name']} {phase['ms']} ms"
+    if phase["change"] is not None:
+        text += f" ({phase['change']:+.0%} vs. earlier boots)"
+    return text
+
+class Realm:
+    """One worldserver and its optional authserver, supervised by the Supervisor.
+
+    Process discovery, the reactor, the DB pool and resource sampling are
+    shared through the supervisor; a realm only owns its processes and tails.
+    """
+
+    def __init__(self, supervisor, realm_settings, show_name=False):
+        self.supervisor = supervisor
+        self.settings = realm_settings
+        self.id = realm_settings.ID
+        self.name = realm_settings.NAME
+
+        # Log sources and process registry keys
+        self.world_key = f"{self.id}.world"
+        self.auth_key = f"{self.id}.auth"
+
+        suffix = f" ({self.name})" if show_name else ""
+        self.world_label = f"Worldserver{suffix}"
+        self.auth_label = f"Authserver{suffix}"
+
+        self.auth_process = None
+        self.world_process = None
+        self.auth_tailer = None
+        self.world_tailer = None
+
+        # Since the manager started, worldserver exits handled by monitor_worldserver
+        self.restarts = 0
+        self.crashes = 0
+
+        self.restart_policy = RestartPolicy.from_settings(supervisor.settings)
+        self.world_started_at = None
+        self.world_ready = False
+        # Downtime of a restart waiting for its delay, then for the new world to be ready
+        self.pending_restart = None
+        self.awaiting_ready = None
+        self.downtimes = collections.deque(maxlen=DOWNTIME_HISTORY)
+        self.downtime_seconds = 0.0
+
+        # Load phases of every boot, from Server.log or the console when there is no log file
+        self.boot_profiler = BootProfiler(
+            os.path.join(supervisor.settings.SPILL_DIRECTORY, "boot_profiles.jsonl"), self.id
+        )
+
+        # Called with worldserver console output (not the log file), on the reactor thread
+        self.line_listeners = []
+        # Console commands and the output they produce
+        self.commands = CommandChannel(self)
+
+        supervisor.processes.track(self.world_key, self.settings.WORLD_PATH)
+        if self.has_auth:
+            supervisor.processes.track(self.auth_key, self.settings.AUTH_PATH)
+
+    @property
+    def has_auth(self):
+        return bool(self.settings.AUTH_PATH)
+
+    @property
+    def log(self):
+        return self.supervisor.log
+
+    def log_world(self, text):
+        self.log.write(self.world_key, text)
+        if self.supervisor.search:
+            self.supervisor.search.ingest(self.world_key, text)
+
+    def log_auth(self, text):
+        self.log.write(self.auth_key, text)
+        if self.supervisor.search:
+            self.supervisor.search.ingest(self.auth_key, text)
+
+    def on_world_log(self, text):
+        self.log_world(text)
+        self.boot_profiler.feed(text)
+
+    def on_world_output(self, text):
+        self.log_world(text)
+        if not self.settings.WORLD_LOG_FILE:
+            self.boot_profiler.feed(text)
+        if not self.world_ready and WORLD_READY in text:
+            self.supervisor.executor.post(self.on_world_ready)
+        for fn in list(self.line_listeners):
+            fn(text)
+
+    def add_line_listener(self, fn):
+        self.line_listeners.append(fn)
+
+    def remove_line_listener(self, fn):
+        if fn in self.line_listeners:
+            self.line_listeners.remove(fn)
+
+    def world_running(self):
+        return self.supervisor.processes.is_running(self.world_key)
+
+    def auth_running(self):
+        return self.has_auth and self.supervisor.processes.is_running(self.auth_key)
+
+    def execute(self, command, timeout=None, prefix="[Input] ", display=None):
+        """Send a console command, returns a Future of its CommandResult."""
+        return self.commands.execute(command, timeout, prefix, display)
+
+    def send_world_command(self, command, prefix="[Input] ", display=None):
+        # Fire and forget, the reply only shows up in the console tab
+        future = self.execute(command, prefix=prefix, display=display)
+        if future.done() and future.exception():
+            error = future.exception()
+            if isinstance(error, ServerNotRunning):
+                self.log.manager(f"❗ {error}\n")
+            else:
+                self.log.manager(f"❗ Failed to send command: {error}\n")
+            return False
+        return True
+
+    def start_authserver(self):
+        if not self.has_auth:
+            return
+        if self.auth_running():
+            self.log.manager(f"❗ {self.auth_label} are already running.\n")
+            return
+
+        try:
+            # stdout/stderr are read by the reactor, no threads per server
+            self.auth_process = self.supervisor.reactor.spawn(
+                [self.settings.AUTH_PATH],
+                cwd=os.path.dirname(self.settings.AUTH_PATH),
+                on_line=self.log_auth,
+            )
+            self.supervisor.processes.register(self.auth_key, self.auth_process)
+
+            self.stop_tailer("auth")
+            self.auth_tailer = self.tail_log_file(self.settings.AUTH_LOG_FILE, self.log_auth)
+
+            self.supervisor.emit("status", self.id)
+            self.log.manager(f"🔴 {self.auth_label} started.\n")
+
+        except Exception as e:
+            self.log.manager(f"❗ Error starting {self.auth_label}: {e}\n")
+
+    def start_worldserver(self, restart=False):
+        if self.world_running():
+            self.log.manager(f"❗ {self.world_label} are already running.\n")
+            return
+        if not restart:
+            # Started by hand: forget the backoff, the breaker and any scheduled restart
+            self.restart_policy.reset()
+            self.pending_restart = None
+            self.awaiting_ready = None
+
+        # Before spawning, so the new console's first prompt cannot be missed
+        self.commands.reset(started=True)
+        try:
+            # stdout/stderr and the exit watcher run on the reactor, no threads per server
+            process = self.supervisor.reactor.spawn(
+                [self.settings.WORLD_PATH],
+                cwd=os.path.dirname(self.settings.WORLD_PATH),
+                on_line=self.on_world_output,
+                on_exit=lambda exit_code: self.supervisor.executor.post(lambda: self.monitor_worldserver(process, exit_code)),
+                stdin=True,
+                prompt=PROMPT,
+            )
+            self.world_process = process
+            self.world_started_at = time.monotonic()
+            self.world_ready = False
+            self.boot_profiler.start()
+            self.supervisor.processes.register(self.world_key, self.world_process)
+
+            self.stop_tailer("world")
+            self.world_tailer = self.tail_log_file(self.settings.WORLD_LOG_FILE, self.on_world_log)
+
+            self.supervisor.emit("status", self.id)
+            self.log.manager(f"🔴 {self.world_label} started.\n")
+
+        except Exception as e:
+            self.log.manager(f"❗ Error starting {self.world_label}: {e}\n")
+
+    def tail_log_file(self, filepath, log_function):
+        if not filepath:
+            return None
+        return self.supervisor.reactor.tail(LogTailer(filepath, log_function, on_error=self.log.manager))
+
+    def stop_tailer(self, name):
+        tailer = getattr(self, f"{name}_tailer")
+        if tailer:
+            tailer.stop()
+            setattr(self, f"{name}_tailer", None)
+
+    def kill_authserver(self):
+        self.stop_tailer("auth")
+        if self.auth_process:
+            self.auth_process.terminate()
+            self.auth_process = None
+
+        self.log.manager(f"🔴 {self.auth_label} killed.\n")
+        self.supervisor.emit("status", self.id)
+
+    def stop_worldserver(self):
+        self.stop_tailer("world")
+        self.cancel_restart()
+
+        if self.world_process:
+            self.world_process.write("server exit" + '\n')
+            self.world_process = None
+        self.commands.reset(reason=f"{self.world_label} stopped.")
+
+        self.log.manager(f"🔴 {self.world_label} stopped.\n")
+        self.supervisor.emit("status", self.id)
+
+    def kill_worldserver(self):
+        self.stop_tailer("world")
+        self.cancel_restart()
+        if self.world_process:
+            self.world_process.terminate()
+            self.world_process = None
+        self.commands.reset(reason=f"{self.world_label} killed.")
+
+        self.log.manager(f"🔴 {self.world_label} killed.\n")
+        self.supervisor.emit("status", self.id)
+
+    def cancel_restart(self):
+        self.pending_restart = None
+        self.awaiting_ready = None
+        self.world_ready = False
+
+    def on_world_ready(self):
+        # The console prompt or the "ready" log line, whichever comes first
+        if self.world_ready or not self.world_process:
+            return
+        self.world_ready = True
+        self.supervisor.emit("status", self.id)
+
+        profile = self.boot_profiler.current
+        if profile:
+            self.supervisor.scheduler.after(BOOT_SETTLE, lambda: self.finish_boot_profile(profile))
+
+        downtime = self.awaiting_ready
+        if downtime is None:
+            return
+        self.awaiting_ready = None
+        downtime.time_to_ready = time.monotonic() - downtime.exited_at
+        self.downtimes.append(downtime)
+        self.downtime_seconds += downtime.time_to_ready
+        self.log.manager(f"🔴 {self.world_label} ready {downtime.time_to_ready:.1f} s after exiting.\n")
+        try:
+            downtime.save(os.path.join(self.supervisor.settings.SPILL_DIRECTORY, "restarts.csv"), self.id)
+        except OSError as e:
+            self.log.manager(f"❗ Could not save restart time: {e}\n")
+
+    def finish_boot_profile(self, profile):
+        try:
+            if not self.boot_profiler.finish(profile):
+                return
+        except OSError as e:
+            self.log.manager(f"❗ Could not save boot profile: {e}\n")
+            return
+
+        _, phases = self.boot_profiler.report(profile)
+        slowest = ", ".join(phase_text(phase) for phase in phases[:3])
+        self.log.manager(
+            f"⏱️ {self.world_label} boot: {len(profile.phases)} load phases, "
+            f"{profile.total_ms / 1000:.1f} s. Slowest: {slowest}\n"
+        )
+
+    def monitor_worldserver(self, process, exit_code):
+        self.log.manager(f"🔴 {self.world_label} exited with code: {exit_code}\n")
+        self.supervisor.emit("status", self.id)
+        if process is not self.world_process:
+            return # stopped or killed from the manager
+        self.world_process = None
+        self.world_ready = False
+        self.awaiting_ready = None
+        self.commands.reset(reason=f"{self.world_label} exited with code {exit_code}.")
+        uptime = time.monotonic() - self.world_started_at
+
+        if exit_code == EXIT_CRASH:
+            self.crashes += 1
+            self.supervisor.emit("crash", self.id, exit_code)
+            timestamp = datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+            self.log.manager(f"❗ {self.world_label} crash at {timestamp}.\n")
+            if not self.supervisor.settings.RESTART_WORLDSERVER_ON_CRASH:
+                return
+        elif exit_code != EXIT_RESTART:
+            return
+        self.schedule_restart(exit_code, uptime)
+
+    def schedule_restart(self, exit_code, uptime):
+        policy = self.restart_policy
+        delay = policy.next_delay(exit_code, uptime)
+        if delay is None:
+            self.log.manager(
+                f"❗ {self.world_label} crashed {policy.recent_crashes} times within {policy.window:.0f} s, "
+                "automatic restarts are paused until it is started by hand.\n"
+            )
+            self.supervisor.emit("crash_loop", self.id)
+            return
+
+        downtime = Downtime(exit_code, delay, time.monotonic())
+        self.pending_restart = downtime
+        if delay:
+            self.log.manager(f"🔴 Restarting {self.world_label} in {delay:g} s...\n")
+        else:
+            self.log.manager(f"🔴 Restarting {self.world_label}...\n")
+        self.supervisor.scheduler.after(int(delay * 1000), lambda: self.restart_worldserver(downtime))
+
+    def restart_worldserver(self, downtime):
+        if downtime is not self.pending_restart:
+            return # started, stopped or killed by hand in the meantime
+        self.pending_restart = None
+        self.restarts += 1
+        self.start_worldserver(restart=True)
+        if self.world_process:
+            self.awaiting_ready = downtime
+
+    def shutdown(self):
+        self.stop_tailer("auth")
+        self.stop_tailer("world")
@@ -0,0 +1,90 @@
+import collections
+import datetime
+import os
+import time
+
+# Exit codes of the worldserver that ask for a restart
+EXIT_CRASH = 1
+EXIT_RESTART = 2
+
+class RestartPolicy:
+    """Backoff and crash-loop breaker for automatic worldserver restarts.
+
+    Crashes in a row wait initial_delay, then multiplier times longer each
+    time, up to max_delay; a run of at least stable_after seconds starts the
+    backoff over. Planned restarts (exit code 2) go ahead right away and
+    never count as crashes. More than max_restarts crashes within window
+    seconds trip the breaker: nothing is restarted until the worldserver is
+    started by hand.
+    """
+
+    def __init__(self, initial_delay=5, max_delay=300, multiplier=2, max_restarts=5, window=600, stable_after=300):
+        self.initial_delay = float(initial_delay)
+        self.max_delay = float(max_delay)
+        self.multiplier = max(1.0, float(multiplier))
+        self.max_restarts = int(max_restarts)
+        self.window = float(window)
+        self.stable_after = float(stable_after)
+
+        self.failures = 0
+        self.tripped = False
+        self._crashes = collections.deque()
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(
+            settings.RESTART_INITIAL_DELAY,
+            settings.RESTART_MAX_DELAY,
+            settings.RESTART_MULTIPLIER,
+            settings.RESTART_MAX_COUNT,
+            settings.RESTART_WINDOW,
+            settings.RESTART_STABLE_AFTER,
+        )
+
+    @property
+    def recent_crashes(self):
+        # Crashes within the window, including the one that tripped the breaker
+        return len(self._crashes)
+
+    def reset(self):
+        # The worldserver was started by hand
+        self.failures = 0
+        self.tripped = False
+        self._crashes.clear()
+
+    def next_delay(self, exit_code, uptime, now=None):
+        """Seconds to wait before restarting, or None when the breaker trips."""
+        now = now if now is not None else time.monotonic()
+        if uptime >= self.stable_after:
+            self.failures = 0
+        if exit_code == EXIT_RESTART:
+            return 0.0
+
+        while self._crashes and now - self._crashes[0] > self.window:
+            self._crashes.popleft()
+        self._crashes.append(now)
+        if self.max_restarts > 0 and len(self._crashes) > self.max_restarts:
+            self.tripped = True
+            return None
+
+        self.failures += 1
+        return min(self.max_delay, self.initial_delay * self.multiplier ** (self.failures - 1))
+
+class Downtime:
+    """One automatic restart, from the exit to the new world being ready."""
+
+    def __init__(self, exit_code, delay, exited_at):
+        self.date = datetime.datetime.now()
+        self.exit_code = exit_code
+        self.delay = delay
+        self.exited_at = exited_at
+        self.time_to_ready = None
+
+    def save(self, path, realm_id):
+        # One row per restart, like startup.csv
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        new_file = not os.path.exists(path)
+        with open(path, 'a', encoding='utf-8') as f:
+            if new_file:
+                f.write("date,realm,exit_code,delay_s,time_to_ready_s\n")
+            f.write(f"{self.date:%Y-%m-%d %H:%M:%S},{realm_id},{self.exit_code},{self.delay:.1f},{self.time_to_ready:.1f}\n")
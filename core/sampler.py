@@ -0,0 +1,78 @@
+import threading
+
+class ResourceSampler:
+    """Samples CPU and RAM of the managed servers on a single background thread.
+
+    CPU is computed by psutil from the delta between two consecutive ticks, so
+    a sample never blocks waiting for a measurement window.
+    """
+
+    def __init__(self, get_pids, interval=3.0, on_error=None, on_sample=None):
+        # get_pids returns {server key: pid or None}, e.g. {"main.world": 1234}
+        self._get_pids = get_pids
+        self.interval = float(interval)
+        self._on_error = on_error
+        self._on_sample = on_sample
+        self._handles = {}
+        self._num_cpus = 1
+        self._stop = threading.Event()
+        self._thread = None
+        self.latest = {}
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        # psutil is first imported here, off the UI thread
+        import psutil
+        self._num_cpus = psutil.cpu_count() or 1
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def _handle(self, name, pid):
+        import psutil
+        handle = self._handles.get(name)
+        if handle is None or handle.pid != pid:
+            handle = psutil.Process(pid)
+            # Prime the CPU counter, the first real value comes next tick
+            handle.cpu_percent(interval=None)
+            self._handles[name] = handle
+        return handle
+
+    def sample(self):
+        import psutil
+        usage_info = {}
+
+        for name, pid in self._get_pids().items():
+            usage_info[name] = {"cpu": 0.0, "mem": 0.0}
+            if not pid:
+                self._handles.pop(name, None)
+                continue
+            try:
+                handle = self._handle(name, pid)
+                with handle.oneshot():
+                    cpu = handle.cpu_percent(interval=None)
+                    rss = handle.memory_info().rss
+                # Normalize CPU usage by number of cores
+                usage_info[name]["cpu"] = round(cpu / self._num_cpus, 2)
+                usage_info[name]["mem"] = round(rss / (1024 ** 2), 2)  # in MB
+            except psutil.NoSuchProcess:
+                self._handles.pop(name, None)
+            except Exception as e:
+                self._handles.pop(name, None)
+                if self._on_error:
+                    self._on_error(name, e)
+
+        # Swap in the whole dict so readers never see a half written sample
+        self.latest = usage_info
+        if self._on_sample:
+            self._on_sample(usage_info)
+        return usage_info
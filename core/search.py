@@ -0,0 +1,192 @@
+import datetime
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from core.logfile import LogFile
+
+# Seconds between two batches written to the capture files and the index
+INDEX_INTERVAL = 1.0
+# Lines around every hit
+CONTEXT_LINES = 2
+# Hits returned by one search
+MAX_HITS = 200
+# Offsets take the low bits of a posting, the capture file id the rest
+OFFSET_BITS = 40
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, source TEXT NOT NULL, path TEXT NOT NULL UNIQUE);
+CREATE VIRTUAL TABLE IF NOT EXISTS postings USING fts5(line, content='');
+"""
+
+class SearchHit:
+    def __init__(self, source, path, offset, line, before, after):
+        self.source = source
+        self.path = path
+        self.offset = offset
+        self.line = line
+        self.before = before
+        self.after = after
+
+def fts_query(text):
+    """FTS5 query matching lines that contain every word of text, "word*" matches a prefix."""
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*")
+        if not re.search(r"\w", word):
+            continue
+        terms.append('"' + word.replace('"', '""') + '"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+class LogIndex:
+    """On-disk capture of every server log line with an incremental full-text index.
+
+    ingest() may be called from any thread and only queues the text. A
+    background thread appends the lines to one capture file per source and
+    day (SPILL_DIRECTORY/capture/<source>-<date>.log, prefixed with the time)
+    and adds each line to a contentless SQLite FTS5 table whose postings
+    point back at (capture file, byte offset), so nothing but the index is
+    read to find a term and the text comes from the capture file. Lines are
+    flushed to disk before they are indexed, a hit always has its line.
+    """
+
+    def __init__(self, directory, interval=INDEX_INTERVAL):
+        self.directory = directory
+        self.path = os.path.join(directory, "index.sqlite3")
+        self.interval = float(interval)
+        self.lines_indexed = 0
+        self._queue = queue.SimpleQueue()
+        self._files = {}
+        self._db = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="log-index", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(self.interval * 5)
+
+    def ingest(self, source, text):
+        self._queue.put((time.time(), source, text))
+
+    def _run(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        # Readers search while the next batch is written
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        try:
+            while not self._stop.wait(self.interval):
+                self.flush()
+            self.flush()
+        finally:
+            for f, _ in self._files.values():
+                f.close()
+            self._files.clear()
+            self._db.close()
+
+    def flush(self):
+        """Write and index everything queued so far, on the index thread."""
+        postings = []
+        try:
+            while True:
+                at, source, text = self._queue.get_nowait()
+                f, file_id = self._capture_file(source, at)
+                stamp = datetime.datetime.fromtimestamp(at).strftime("%Y-%m-%d %H:%M:%S ")
+                for line in text.splitlines():
+                    if not line.strip():
+                        continue
+                    offset = f.tell()
+                    f.write(f"{stamp}{line}\n".encode("utf-8", errors="replace"))
+                    postings.append(((file_id << OFFSET_BITS) | offset, line))
+        except queue.Empty:
+            pass
+        except OSError:
+            pass  # Never let a full disk stop the readers, the lines are still shown
+
+        if not postings:
+            return
+        for f, _ in self._files.values():
+            f.flush()
+        with self._db:
+            self._db.executemany("INSERT INTO postings (rowid, line) VALUES (?, ?)", postings)
+        self.lines_indexed += len(postings)
+
+    def _capture_file(self, source, at):
+        day = datetime.date.fromtimestamp(at).isoformat()
+        key = (source, day)
+        if key not in self._files:
+            # A new day starts a new file, close the day before
+            for old in [k for k in self._files if k[0] == source]:
+                self._files.pop(old)[0].close()
+            path = os.path.join(self.directory, f"{source}-{day}.log")
+            self._db.execute("INSERT OR IGNORE INTO files (source, path) VALUES (?, ?)", (source, path))
+            file_id = self._db.execute("SELECT id FROM files WHERE path = ?", (path,)).fetchone()[0]
+            self._db.commit()
+            self._files[key] = (open(path, "ab"), file_id)
+        return self._files[key]
+
+    def search(self, text, sources=None, limit=MAX_HITS, context=CONTEXT_LINES):
+        """Newest hits first, lines containing every word of text. Blocking, call it off the UI thread."""
+        query = fts_query(text)
+        if not query or not os.path.exists(self.path):
+            return []
+
+        db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        try:
+            # A query FTS5 cannot parse or an index still being created finds nothing
+            files = {file_id: (source, path) for file_id, source, path in db.execute("SELECT id, source, path FROM files")}
+            wanted = None
+            if sources is not None:
+                wanted = [file_id for file_id, (source, _) in files.items() if source in sources]
+                if not wanted:
+                    return []
+            # Later capture files have higher ids, so rowid order is newest first within a source
+            sql = "SELECT rowid FROM postings WHERE postings MATCH ?"
+            args = [query]
+            if wanted is not None:
+                ranges = " OR ".join("rowid BETWEEN ? AND ?" for _ in wanted)
+                sql += f" AND ({ranges})"
+                for file_id in wanted:
+                    args += [file_id << OFFSET_BITS, ((file_id + 1) << OFFSET_BITS) - 1]
+            sql += " ORDER BY rowid DESC LIMIT ?"
+            args.append(limit)
+            rowids = [row[0] for row in db.execute(sql, args)]
+        except sqlite3.Error:
+            return []
+        finally:
+            db.close()
+
+        hits = []
+        logs = {}
+        try:
+            for rowid in rowids:
+                file_id, offset = rowid >> OFFSET_BITS, rowid & ((1 << OFFSET_BITS) - 1)
+                source, path = files[file_id]
+                if path not in logs:
+                    try:
+                        logs[path] = LogFile(path).open()
+                    except OSError:
+                        logs[path] = None  # Capture file deleted by hand
+                log = logs[path]
+                if log is None or offset >= log.size:
+                    continue
+                before = [line for start, line in log.lines(log.move(offset, -context), context) if start < offset]
+                line, end = log.read_line(offset)
+                after = [line for _, line in log.lines(end, context)] if end < log.size else []
+                hits.append(SearchHit(source, path, offset, line, before, after))
+        finally:
+            for log in logs.values():
+                if log:
+                    log.close()
+        return hits
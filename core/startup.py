@@ -0,0 +1,36 @@
+import datetime
+import os
+import sys
+import time
+
+class StartupTimer:
+    """Milliseconds from start to each startup phase, appended to a CSV report.
+
+    The report gets one row per launch so startup time can be compared
+    between releases and between the script and the PyInstaller build.
+    """
+
+    def __init__(self, start=None):
+        self.start = start if start is not None else time.perf_counter()
+        self.marks = []
+
+    def mark(self, name, at=None):
+        at = at if at is not None else time.perf_counter()
+        self.marks.append((name, (at - self.start) * 1000))
+
+    def report(self):
+        return " | ".join(f"{name} {ms:.0f} ms" for name, ms in self.marks)
+
+    def save(self, path):
+        header = ["date", "frozen"] + [name for name, _ in self.marks]
+        row = [
+            datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "1" if getattr(sys, 'frozen', False) else "0",
+        ] + [f"{ms:.1f}" for _, ms in self.marks]
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        new_file = not os.path.exists(path)
+        with open(path, 'a', encoding='utf-8') as f:
+            if new_file:
+                f.write(",".join(header) + "\n")
+            f.write(",".join(row) + "\n")
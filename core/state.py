@@ -0,0 +1,73 @@
+import json
+import time
+from core import prometheus
+
+class StateCache:
+    """Point in time view of every realm, rebuilt on the scheduler thread.
+
+    Readers on other threads (the control API) only ever see a complete
+    snapshot: update() replaces the dict, its pre-encoded JSON and its
+    Prometheus rendering instead of changing them.
+    """
+
+    def __init__(self):
+        self.snapshot = {"time": None, "realms": []}
+        self.body = json.dumps(self.snapshot).encode()
+        self.metrics = b""
+
+    def update(self, supervisor):
+        pids = supervisor.server_pids()
+        usage = supervisor.resource_usage() or {}
+
+        realms = []
+        for realm in supervisor.realms:
+            stats = supervisor.stats.snapshot(realm.id)
+            realms.append({
+                "id": realm.id,
+                "name": realm.name,
+                "world": self._server(realm.world_key, pids, usage),
+                "auth": self._server(realm.auth_key, pids, usage) if realm.has_auth else None,
+                "players": self._players(stats) if stats else None,
+                "commands_outstanding": realm.commands.outstanding,
+                "restarts": realm.restarts,
+                "crashes": realm.crashes,
+                "world_ready": realm.world_ready,
+                "restart_pending": realm.pending_restart is not None,
+                "crash_loop": realm.restart_policy.tripped,
+                "last_time_to_ready": realm.downtimes[-1].time_to_ready if realm.downtimes else None,
+                "downtime_seconds": realm.downtime_seconds,
+            })
+
+        stats = supervisor.stats
+        snapshot = {
+            "time": time.time(),
+            "realms": realms,
+            "log": supervisor.log.stats(),
+            "database": {
+                "queries": stats.queries,
+                "query_seconds": stats.query_seconds,
+                "last_query_seconds": stats.last_query_seconds,
+            },
+        }
+        self.body = json.dumps(snapshot).encode()
+        self.metrics = prometheus.render(snapshot).encode()
+        self.snapshot = snapshot
+
+    def _server(self, key, pids, usage):
+        info = usage.get(key, {})
+        return {
+            "running": pids.get(key) is not None,
+            "pid": pids.get(key),
+            "cpu": info.get("cpu", 0.0),
+            "memory_mb": info.get("mem", 0.0),
+        }
+
+    def _players(self, stats):
+        return {
+            "online": stats.online,
+            "gms": stats.gms,
+            "tickets": stats.tickets,
+            "alliance": stats.alliance,
+            "horde": stats.horde,
+            "updated": stats.timestamp,
+        }
@@ -0,0 +1,85 @@
+import time
+
+ALLIANCE_RACES = {1, 3, 4, 7, 11, 22}
+HORDE_RACES = {2, 5, 6, 8, 9, 10}
+
+class StatsSnapshot:
+    """Server stats captured by a single StatsCollector round trip."""
+
+    def __init__(self, online=0, gms=0, tickets=0, races=None, timestamp=None):
+        self.online = online
+        self.gms = gms
+        self.tickets = tickets
+        self.races = races or {}
+        self.timestamp = timestamp if timestamp is not None else time.time()
+
+    @property
+    def alliance(self):
+        return sum(count for race, count in self.races.items() if race in ALLIANCE_RACES)
+
+    @property
+    def horde(self):
+        return sum(count for race, count in self.races.items() if race in HORDE_RACES)
+
+class StatsCollector:
+    """Fetches the stats of every running realm in a single round trip."""
+
+    def __init__(self, db, settings):
+        self.db = db
+        self.settings = settings
+        self.snapshots = {}
+
+        # Round trip times of successful stats queries, for the metrics endpoint
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.last_query_seconds = None
+
+    def _query(self, realms):
+        auth = self.settings.DATABASE_AUTH
+        parts = []
+        for index, realm in enumerate(realms):
+            characters = realm.DATABASE_CHARACTERS
+            parts.append(f"""
+                SELECT {index}, 'race', race, COUNT(*) FROM {characters}.characters
+                WHERE online = 1 GROUP BY race
+                UNION ALL
+                SELECT {index}, 'gms', 0, COUNT(*) FROM {characters}.characters c
+                JOIN {auth}.account_access a ON c.account = a.id
+                WHERE c.online = 1 AND a.gmlevel > 0
+                UNION ALL
+                SELECT {index}, 'tickets', 0, COUNT(*) FROM {characters}.gm_ticket
+                WHERE type = 0
+            """)
+        return " UNION ALL ".join(parts) + ";"
+
+    def collect(self, realms):
+        """Return {realm id: StatsSnapshot} for the given RealmSettings."""
+        if not realms:
+            return {}
+        started = time.perf_counter()
+        rows = self.db.fetchall(self._query(realms))
+        elapsed = time.perf_counter() - started
+        # Only one collection runs at a time, see Supervisor.poll_stats
+        self.queries += 1
+        self.query_seconds += elapsed
+        self.last_query_seconds = elapsed
+
+        snapshots = {realm.ID: StatsSnapshot() for realm in realms}
+        for index, kind, key, count in rows:
+            snapshot = snapshots[realms[int(index)].ID]
+            if kind == 'race':
+                snapshot.races[int(key)] = int(count)
+            elif kind == 'gms':
+                snapshot.gms = int(count)
+            elif kind == 'tickets':
+                snapshot.tickets = int(count)
+        for snapshot in snapshots.values():
+            snapshot.online = sum(snapshot.races.values())
+        return snapshots
+
+    def update(self, snapshots):
+        # Realms missing from a collection are offline
+        self.snapshots = snapshots
+
+    def snapshot(self, realm_id):
+        return self.snapshots.get(realm_id)
@@ -0,0 +1,244 @@
+import os
+from core.database import DatabasePool
+from core.executor import QueryExecutor
+from core.metrics import MetricsStore
+from core.process import ProcessRegistry
+from core.search import LogIndex
+from core.realm import Realm
+from core.sampler import ResourceSampler
+from core.state import StateCache
+from core.stats import StatsCollector
+
+# Seconds between rebuilds of the cached state served by the control API
+STATE_INTERVAL = 3
+
+class Supervisor:
+    """Process supervision, log capture and stats, independent of any GUI.
+
+    scheduler is anything offering Tk's after(ms, fn): the Tk root for the
+    manager window or a core.mainloop.MainLoop for the headless daemon. All
+    public methods and listeners run on the scheduler's thread.
+
+    log is any object with manager(text), write(source, text), stats() and a
+    LogHistory as history; realms write under "<realm id>.world" and
+    "<realm id>.auth".
+
+    Every configured realm (see settings.REALMS) shares the process registry,
+    reactor, DB pool, sampler and stats poll.
+
+    Listeners can subscribe to:
+      "status" (realm_id)             a server was started, stopped or exited
+      "stats"  ({realm_id: snapshot}) new stats, running realms only
+      "crash"  (realm_id, exit_code)  a worldserver crashed
+      "crash_loop" (realm_id)         automatic restarts were paused
+    """
+
+    def __init__(self, settings, scheduler, log):
+        self.settings = settings
+        self.scheduler = scheduler
+        self.log = log
+        self.listeners = {"status": [], "stats": [], "crash": [], "crash_loop": []}
+
+        self.db = DatabasePool(self.settings)
+        self.stats = StatsCollector(self.db, self.settings)
+
+        # History of resources and player counts for the charts
+        self.metrics = MetricsStore(self.settings.METRICS_FILE)
+
+        self.stats_in_flight = False
+
+        # Find servers started outside the manager once, then follow them by PID
+        self.processes = ProcessRegistry()
+
+        self.sampler = ResourceSampler(
+            self.server_pids,
+            interval=self.settings.RESOURCE_INTERVAL,
+            on_error=self.on_sampler_error,
+            on_sample=self.record_resources,
+        )
+
+        # One I/O thread for every child pipe, log tail and exit watcher, created by start()
+        self.reactor = None
+
+        # Every server log line on disk with a full-text index, None when switched off
+        self.search = None
+        if self.settings.INDEX_LOGS:
+            self.search = LogIndex(os.path.join(self.settings.SPILL_DIRECTORY, "capture"))
+
+        # What the control API serves, so requests never scan processes or query MySQL
+        self.state = StateCache()
+        self.api = None
+        self.metrics_server = None
+
+        # Blocking DB calls never run on the scheduler thread
+        self.executor = QueryExecutor(self.scheduler, workers=self.settings.DATABASE_POOL_SIZE)
+
+        show_names = len(self.settings.REALMS) > 1
+        self.realms = [Realm(self, realm_settings, show_names) for realm_settings in self.settings.REALMS]
+        self.realms_by_id = {realm.id: realm for realm in self.realms}
+
+    def subscribe(self, event, fn):
+        self.listeners[event].append(fn)
+
+    def emit(self, event, *args):
+        for fn in self.listeners[event]:
+            fn(*args)
+
+    def start(self):
+        try:
+            self.metrics.open()
+        except OSError as e:
+            self.log.manager(f"❗ Could not open metrics file: {e}\n")
+        # asyncio is only imported once the caller is ready to supervise
+        from core.reactor import Reactor
+        self.reactor = Reactor()
+
+        self.processes.discover()
+        self.reactor.start()
+        self.sampler.start()
+        if self.search:
+            self.search.start()
+        self.executor.submit(self.test_connect_mysql, timeout=float(self.settings.DATABASE_TIMEOUT))
+        self.poll_stats()
+
+        self.subscribe("status", lambda realm_id: self.refresh_state())
+        self.subscribe("stats", lambda snapshots: self.refresh_state())
+        self.update_state()
+        self.start_api()
+
+    def start_api(self):
+        from core.api import ControlServer
+        port = int(self.settings.API_PORT or 0)
+        socket_path = self.settings.API_SOCKET or None
+        if port or socket_path:
+            api = ControlServer(self, self.settings.API_HOST, port, socket_path, self.settings.API_TOKEN or None)
+            self.api = self.start_server(api, "Control API")
+
+        # Separate read-only port for Prometheus
+        metrics_port = int(self.settings.METRICS_PORT or 0)
+        if metrics_port:
+            server = ControlServer(self, self.settings.METRICS_HOST, metrics_port, metrics_only=True)
+            self.metrics_server = self.start_server(server, "Metrics endpoint")
+
+    def start_server(self, server, name):
+        try:
+            server.start()
+        except OSError as e:
+            self.log.manager(f"❗ Could not start the {name}: {e}\n")
+            return None
+        self.log.manager(f"🔴 {name} listening on {server.address}.\n")
+        return server
+
+    def shutdown(self):
+        for realm in self.realms:
+            realm.shutdown()
+        self.executor.shutdown()
+        self.sampler.stop()
+        for server in (self.api, self.metrics_server):
+            if server:
+                server.stop()
+        if self.reactor:
+            self.reactor.stop()
+        if self.search:
+            self.search.stop()
+        self.metrics.close()
+
+    def test_connect_mysql(self):
+        from mysql.connector import Error
+        try:
+            with self.db.connection() as connection:
+                if connection.is_connected():
+                    self.log.manager("🔴 MySQL test connection successful for DB: Characters.\n")
+                    return True
+        except Error as e:
+            self.log.manager(f"❗ MySQL connection failed: {e}\n")
+        return False
+
+    # --- Realms ---
+
+    def realm(self, realm_id):
+        return self.realms_by_id.get(realm_id)
+
+    def command_realm(self):
+        # Account tools talk to the first realm with a running worldserver
+        for realm in self.realms:
+            if realm.world_process and realm.world_process.poll() is None:
+                return realm
+        return self.realms[0]
+
+    def world_running(self):
+        return any(realm.world_running() for realm in self.realms)
+
+    def server_pids(self):
+        pids = {}
+        for realm in self.realms:
+            pids[realm.world_key] = self.processes.pid(realm.world_key)
+            if realm.has_auth:
+                pids[realm.auth_key] = self.processes.pid(realm.auth_key)
+        return pids
+
+    def on_sampler_error(self, key, e):
+        realm_id, _, kind = key.rpartition(".")
+        realm = self.realm(realm_id)
+        label = key
+        if realm:
+            label = realm.world_label if kind == "world" else realm.auth_label
+        self.log.manager(f"❗ Error fetching {label} stats: {e}\n")
+
+    def resource_usage(self):
+        return self.sampler.latest
+
+    def record_resources(self, usage):
+        # Runs on the sampler thread, which also takes care of writing to disk
+        values = {}
+        for key, info in usage.items():
+            values[f"{key}.cpu"] = info["cpu"]
+            values[f"{key}.mem"] = info["mem"]
+        self.metrics.record(values)
+        self.metrics.flush()
+
+    # --- Cached state ---
+
+    def refresh_state(self):
+        self.state.update(self)
+
+    def update_state(self):
+        self.refresh_state()
+        self.scheduler.after(STATE_INTERVAL * 1000, self.update_state)
+
+    # --- Stats ---
+
+    def poll_stats(self):
+        running = [realm.settings for realm in self.realms if realm.world_running()]
+        if running:
+            # Skip this tick if the previous query is still running against a slow DB
+            if not self.stats_in_flight:
+                self.stats_in_flight = True
+                self.executor.submit(
+                    lambda: self.stats.collect(running),
+                    callback=self.on_stats_collected,
+                    errback=self.on_stats_failed,
+                    timeout=float(self.settings.DATABASE_TIMEOUT),
+                )
+        else:
+            self.on_stats_collected({})
+
+        # Single schedule for every stats consumer and every realm
+        self.scheduler.after(int(float(self.settings.STATS_INTERVAL) * 1000), self.poll_stats)
+
+    def on_stats_collected(self, snapshots):
+        self.stats_in_flight = False
+        self.stats.update(snapshots)
+
+        values = {}
+        for realm_id, snapshot in snapshots.items():
+            values[f"{realm_id}.online"] = snapshot.online
+            values[f"{realm_id}.gms"] = snapshot.gms
+            values[f"{realm_id}.tickets"] = snapshot.tickets
+        if values:
+            self.metrics.record(values)
+        self.emit("stats", snapshots)
+
+    def on_stats_failed(self, err):
+        self.stats_in_flight = False
+        self.log.manager(f"❗ poll_stats: MySQL error: {err}\n")
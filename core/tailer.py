@@ -0,0 +1,217 @@
+import codecs
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+import threading
+
+# Bytes read from the log file per read() call
+CHUNK_SIZE = 64 * 1024
+# Safety net wake-up, also the poll rate when no filesystem events are available
+POLL_INTERVAL = 0.5
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+_libc = None
+
+def _load_libc():
+    global _libc
+    if _libc is None and sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1
+            libc.inotify_add_watch
+            _libc = libc
+        except (OSError, AttributeError):
+            _libc = False
+    return _libc or None
+
+class InotifyWatch:
+    """Watches one directory and reports whether events touched a given file name."""
+
+    def __init__(self, directory, filename):
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not available")
+
+        self.filename = os.fsencode(filename)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed for {directory}")
+
+    def fileno(self):
+        return self.fd
+
+    def drain(self):
+        touched = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return touched
+            if not data:
+                return touched
+
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if name == self.filename:
+                    touched = True
+
+    def close(self):
+        os.close(self.fd)
+
+class LogTailer:
+    """Follows a log file across truncation and rotation.
+
+    Rotation is detected by comparing the device/inode of the path with the
+    open file, so a renamed-and-recreated log is picked up even when the new
+    file is already larger than our old offset. Reads are binary chunks fed
+    through an incremental UTF-8 decoder, only complete lines are emitted.
+
+    The tailer has no thread of its own, it is driven by the Reactor.
+    """
+
+    def __init__(self, filepath, on_line, on_error=None, chunk_size=CHUNK_SIZE, poll_interval=POLL_INTERVAL):
+        self.filepath = filepath
+        self.on_line = on_line
+        self.on_error = on_error
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+
+        self._file = None
+        self._identity = None
+        self._decoder = None
+        self._partial = ""
+        self._missing_reported = False
+        self._stop = threading.Event()
+        self._wake_r, self._wake_w = os.pipe()
+        self.watch = None
+
+    def stop(self):
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    def wake_fileno(self):
+        # Becomes readable once stop() is called
+        return self._wake_r
+
+    def report(self, message):
+        if self.on_error:
+            self.on_error(message)
+
+    def open_watch(self):
+        directory = os.path.dirname(os.path.abspath(self.filepath))
+        try:
+            self.watch = InotifyWatch(directory, os.path.basename(self.filepath))
+        except OSError:
+            self.watch = None  # Fall back to polling
+        return self.watch
+
+    def _open(self):
+        try:
+            f = open(self.filepath, "rb")
+        except FileNotFoundError:
+            if not self._missing_reported:
+                self.report(f"❗ Log file not found: {self.filepath}, waiting for it to appear.\n")
+                self._missing_reported = True
+            return False
+
+        st = os.fstat(f.fileno())
+        self._file = f
+        self._identity = (st.st_dev, st.st_ino)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+        self._missing_reported = False
+        return True
+
+    def _rotated(self):
+        try:
+            st = os.stat(self.filepath)
+        except FileNotFoundError:
+            return False  # Renamed away, keep draining the old file until a new one appears
+        if (st.st_dev, st.st_ino) != self._identity:
+            return True
+        # Same file truncated in place
+        return st.st_size < self._file.tell()
+
+    def _reopen(self):
+        # Finish whatever is left in the old file first
+        self._read_chunks()
+        self._flush_partial()
+        self._file.close()
+        self._file = None
+        self._open()
+
+    def poll(self):
+        """Emit every complete line appended since the last call."""
+        try:
+            if self._file is None and not self._open():
+                return
+            if self._rotated():
+                self._reopen()
+                if self._file is None:
+                    return
+            self._read_chunks()
+        except OSError as e:
+            self.report(f"❗ Error reading log {self.filepath}: {e}\n")
+            if self._file:
+                self._file.close()
+            self._file = None
+
+    def _read_chunks(self):
+        while True:
+            chunk = self._file.read(self.chunk_size)
+            if not chunk:
+                return
+            text = self._partial + self._decoder.decode(chunk)
+            lines = text.split("\n")
+            self._partial = lines.pop()
+            for line in lines:
+                self.on_line(line.rstrip("\r") + "\n")
+
+    def _flush_partial(self):
+        if self._partial:
+            self.on_line(self._partial + "\n")
+            self._partial = ""
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self.watch:
+            self.watch.close()
+            self.watch = None
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
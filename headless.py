@@ -0,0 +1,93 @@
+import argparse
+import signal
+import sys
+import threading
+from config.settings import SettingsManager
+from core.console import ConsoleLogger
+from core.mainloop import MainLoop
+from core.supervisor import Supervisor
+
+# Headless supervisor, no Tk or matplotlib involved
+# python headless.py [--no-auth] [--no-world]
+# Console input goes to the first realm, "@<realm id> <command>" picks another
+
+# Seconds to wait for "server exit" before the worldserver is killed
+SHUTDOWN_TIMEOUT = 60
+
+def send_command(supervisor, line):
+    realm = supervisor.realms[0]
+    command = line
+    if line.startswith("@"):
+        realm_id, _, command = line[1:].partition(" ")
+        realm = supervisor.realm(realm_id)
+        if realm is None:
+            supervisor.log.manager(f"❗ Unknown realm: {realm_id}\n")
+            return
+    if command.strip():
+        realm.send_world_command(command.strip(), prefix="> ")
+
+def read_console(loop, supervisor):
+    # Lines typed on our stdin are forwarded to a worldserver console
+    for line in sys.stdin:
+        line = line.strip()
+        if line:
+            loop.post(lambda line=line: send_command(supervisor, line))
+
+def main():
+    parser = argparse.ArgumentParser(description="AzerothCore Server Manager without a GUI.")
+    parser.add_argument("--no-auth", action="store_true", help="do not start the authserver")
+    parser.add_argument("--no-world", action="store_true", help="do not start the worldserver")
+    args = parser.parse_args()
+
+    settings = SettingsManager()
+    settings.load_settings()
+
+    loop = MainLoop()
+    log = ConsoleLogger()
+    supervisor = Supervisor(settings, loop, log)
+    supervisor.start()
+
+    for realm in supervisor.realms:
+        if not args.no_auth:
+            loop.post(realm.start_authserver)
+        if not args.no_world:
+            loop.post(realm.start_worldserver)
+
+    def wait_for_exit(processes, remaining):
+        processes = [process for process in processes if process.poll() is None]
+        if processes:
+            if remaining > 0:
+                loop.after(1000, lambda: wait_for_exit(processes, remaining - 1))
+                return
+            for process in processes:
+                process.terminate()
+        supervisor.shutdown()
+        loop.stop()
+
+    stopping = []
+
+    def shutdown():
+        if stopping:
+            return
+        stopping.append(True)
+        log.manager("🔴 Shutting down...\n")
+        processes = []
+        for realm in supervisor.realms:
+            if realm.world_process:
+                processes.append(realm.world_process)
+                realm.stop_worldserver()
+            if realm.auth_process:
+                realm.kill_authserver()
+        wait_for_exit(processes, SHUTDOWN_TIMEOUT)
+
+    def on_signal(signum, frame):
+        loop.post(shutdown)
+
+    signal.signal(signal.SIGINT, on_signal)
+    signal.signal(signal.SIGTERM, on_signal)
+
+    threading.Thread(target=read_console, args=(loop, supervisor), name="console", daemon=True).start()
+    loop.run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import os
+import sys
+import tkinter as tk
+from tkinter import filedialog, ttk
+from core.accounts import AccountRow, BulkAccountImport, load_accounts
+
+STATUS_COLORS = {
+    AccountRow.DONE: "green",
+    AccountRow.FAILED: "red",
+}
+
+class BulkImportWindow:
+    """Create many accounts from a CSV or JSON file and follow their progress."""
+
+    def __init__(self, root, supervisor, settings, logger):
+        self.root = root
+        self.supervisor = supervisor
+        self.settings = settings
+        self.logger = logger
+        self.bulk_import = None
+        self.rows = []
+        self.window = None
+
+    def open_bulk_import_window(self):
+        # One window, a running import keeps reporting to its tree
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            return
+
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Bulk Account Import")
+
+        # Get the correct path to the icon
+        if hasattr(sys, '_MEIPASS'):
+            base_path = sys._MEIPASS
+        else:
+            base_path = os.path.abspath(".")
+
+        icon_path = os.path.join(base_path, "assets", "manager.ico")
+        self.window.iconbitmap(icon_path)
+
+        options = tk.Frame(self.window)
+        options.pack(fill='x', padx=5, pady=5)
+
+        tk.Label(options, text="File (CSV/JSON):").grid(row=0, column=0, sticky="w")
+        self.file_entry = tk.Entry(options, width=50)
+        self.file_entry.grid(row=0, column=1, padx=5)
+        tk.Button(options, text="Browse", command=self.browse).grid(row=0, column=2, padx=5)
+        tk.Button(options, text="Load", command=self.load).grid(row=0, column=3, padx=5)
+
+        tk.Label(options, text="Commands per second:").grid(row=1, column=0, sticky="w")
+        self.rate_entry = tk.Entry(options, width=10)
+        self.rate_entry.insert(0, self.settings.ACCOUNT_COMMAND_RATE)
+        self.rate_entry.grid(row=1, column=1, padx=5, sticky="w")
+
+        tk.Label(options, text="Batch size:").grid(row=2, column=0, sticky="w")
+        self.batch_entry = tk.Entry(options, width=10)
+        self.batch_entry.insert(0, self.settings.ACCOUNT_BATCH_SIZE)
+        self.batch_entry.grid(row=2, column=1, padx=5, sticky="w")
+
+        tk.Label(options, text="CSV columns: username,password,gmlevel (gmlevel optional)", fg="gray", font=("Arial", 8)).grid(row=3, column=0, columnspan=4, sticky="w")
+
+        # One line per account
+        self.tree = ttk.Treeview(self.window, columns=("line", "username", "gmlevel", "status", "message"), show="headings", height=15)
+        for column, title, width in (("line", "Line", 50), ("username", "Username", 150), ("gmlevel", "GM", 40), ("status", "Status", 80), ("message", "Message", 300)):
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=width, anchor="w")
+        for status, color in STATUS_COLORS.items():
+            self.tree.tag_configure(status, foreground=color)
+        self.tree.pack(fill='both', expand=True, padx=5)
+
+        self.progress = ttk.Progressbar(self.window, mode="determinate")
+        self.progress.pack(fill='x', padx=5, pady=5)
+
+        self.progress_lbl = tk.Label(self.window, text="No file loaded.", fg="gray")
+        self.progress_lbl.pack(anchor="w", padx=5)
+
+        buttons = tk.Frame(self.window)
+        buttons.pack(pady=5)
+        self.start_btn = tk.Button(buttons, text="Start", command=self.start, state="disabled", width=15)
+        self.start_btn.pack(side=tk.LEFT, padx=5)
+        self.cancel_btn = tk.Button(buttons, text="Cancel", command=self.cancel, state="disabled", width=15)
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+    def browse(self):
+        file_path = filedialog.askopenfilename(filetypes=[("Accounts", "*.csv *.json"), ("All files", "*.*")])
+        if file_path:
+            self.file_entry.delete(0, tk.END)
+            self.file_entry.insert(0, file_path)
+            self.load()
+
+    def load(self):
+        if self.bulk_import and not self.bulk_import.finished:
+            return
+        self.tree.delete(*self.tree.get_children())
+        self.rows = []
+        self.start_btn.config(state="disabled")
+
+        try:
+            rows, errors = load_accounts(self.file_entry.get())
+        except (OSError, ValueError) as e:
+            self.progress_lbl.config(text=f"❗ Could not read file: {e}", fg="red")
+            return
+
+        if errors:
+            # Nothing is sent until every row is valid
+            for error in errors:
+                self.tree.insert("", tk.END, values=("", "", "", AccountRow.FAILED, error), tags=(AccountRow.FAILED,))
+            self.progress_lbl.config(text=f"❗ {len(errors)} invalid rows, fix the file and load it again.", fg="red")
+            return
+
+        self.rows = rows
+        for row in rows:
+            self.tree.insert("", tk.END, iid=str(row.line), values=(row.line, row.username, row.gmlevel, row.status, ""))
+        self.progress.config(maximum=max(1, len(rows)), value=0)
+        self.progress_lbl.config(text=f"{len(rows)} accounts ready.", fg="black")
+        self.start_btn.config(state="normal" if rows else "disabled")
+
+    def start(self):
+        realm = self.supervisor.command_realm()
+        try:
+            rate = float(self.rate_entry.get())
+            batch_size = int(self.batch_entry.get())
+        except ValueError:
+            self.progress_lbl.config(text="❗ Rate and batch size must be numbers.", fg="red")
+            return
+
+        self.bulk_import = BulkAccountImport(realm, self.rows, rate, batch_size, on_progress=self.on_progress)
+        self.start_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+        self.logger.manager(f"🔴 Bulk import of {len(self.rows)} accounts started on {realm.world_label}.\n")
+        self.bulk_import.start()
+
+    def cancel(self):
+        if self.bulk_import and not self.bulk_import.finished:
+            self.bulk_import.cancel()
+
+    def close(self):
+        self.cancel()
+        self.window.destroy()
+
+    def on_progress(self, row):
+        try:
+            self.tree.item(str(row.line), values=(row.line, row.username, row.gmlevel, row.status, row.message), tags=(row.status,))
+        except tk.TclError:
+            return  # Window closed
+        done, failed, total = self.bulk_import.counts()
+        self.progress.config(value=done + failed)
+        self.progress_lbl.config(text=f"{done + failed}/{total} processed, {done} created, {failed} failed.", fg="black")
+
+        if self.bulk_import.finished:
+            self.cancel_btn.config(state="disabled")
+            self.logger.manager(f"🔴 Bulk import finished: {done} created, {failed} failed.\n")
@@ -0,0 +1,76 @@
+import datetime
+import os
+import sys
+import tkinter as tk
+from tkinter import ttk
+
+# Phases at least this much slower than the median of earlier boots are highlighted
+SLOWER_THRESHOLD = 0.2
+
+class BootProfileWindow:
+    """Load phases of a realm's latest boot, slowest first, against earlier boots."""
+
+    def __init__(self, root, realm):
+        self.root = root
+        self.realm = realm
+
+    def open_boot_profile_window(self):
+        self.window = tk.Toplevel(self.root)
+        self.window.title(f"Boot Profile - {self.realm.world_label}")
+
+        # Get the correct path to the icon
+        if hasattr(sys, '_MEIPASS'):
+            base_path = sys._MEIPASS
+        else:
+            base_path = os.path.abspath(".")
+
+        icon_path = os.path.join(base_path, "assets", "manager.ico")
+        self.window.iconbitmap(icon_path)
+
+        self.summary_lbl = tk.Label(self.window, text="", anchor="w", justify="left")
+        self.summary_lbl.pack(fill='x', padx=5, pady=5)
+
+        columns = (
+            ("rank", "#", 40),
+            ("name", "Phase", 300),
+            ("rows", "Rows", 80),
+            ("ms", "ms", 70),
+            ("previous", "Previous boot ms", 110),
+            ("median", "Median ms", 80),
+            ("change", "Change", 70),
+        )
+        self.tree = ttk.Treeview(self.window, columns=[column for column, _, _ in columns], show="headings", height=20)
+        for column, title, width in columns:
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=width, anchor="w")
+        self.tree.tag_configure("slower", foreground="red")
+        self.tree.pack(fill='both', expand=True, padx=5)
+
+        tk.Button(self.window, text="Refresh", command=self.refresh, width=15).pack(pady=5)
+        self.refresh()
+
+    def refresh(self):
+        self.tree.delete(*self.tree.get_children())
+        profile, phases = self.realm.boot_profiler.report()
+        if profile is None:
+            self.summary_lbl.config(text="No boot recorded yet, start the worldserver from the manager.", fg="gray")
+            return
+
+        started = datetime.datetime.fromtimestamp(profile.started).strftime("%Y-%m-%d %H:%M:%S")
+        earlier = len(self.realm.boot_profiler.boots) - 1
+        self.summary_lbl.config(
+            text=f"Boot at {started}: {len(profile.phases)} load phases, {profile.total_ms / 1000:.1f} s, "
+                 f"compared with {earlier} earlier boots.",
+            fg="black",
+        )
+        for rank, phase in enumerate(phases, start=1):
+            change = phase["change"]
+            self.tree.insert("", tk.END, values=(
+                rank,
+                phase["name"],
+                "" if phase["rows"] is None else phase["rows"],
+                phase["ms"],
+                "" if phase["previous_ms"] is None else phase["previous_ms"],
+                "" if phase["median_ms"] is None else f"{phase['median_ms']:.0f}",
+                "" if change is None else f"{change:+.0%}",
+            ), tags=("slower",) if change is not None and change >= SLOWER_THRESHOLD else ())
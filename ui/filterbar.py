@@ -0,0 +1,63 @@
+import re
+import tkinter as tk
+
+# Separates the rules typed into one filter box
+RULE_SEPARATOR = ";"
+
+def split_rules(text):
+    return [rule.strip() for rule in text.split(RULE_SEPARATOR) if rule.strip()]
+
+def matches_every_line(rule):
+    # ".*", "x*" or "error|" match the empty string, so any line at all; "^$" only blank lines
+    pattern = re.compile(rule)
+    return pattern.search("") is not None and pattern.search("\0") is not None
+
+class FilterBar:
+    """Include/exclude boxes of a log tab, applied by the Logger to new lines and the pane's history."""
+
+    def __init__(self, logger, source):
+        self.logger = logger
+        self.source = source
+
+    def create(self, parent):
+        frame = tk.Frame(parent)
+        frame.pack(fill="x", padx=5, pady=(5, 0))
+
+        tk.Label(frame, text="Show:").pack(side="left")
+        self.include_entry = tk.Entry(frame, width=30)
+        self.include_entry.pack(side="left", padx=5)
+        self.include_entry.bind("<Return>", lambda event: self.apply())
+
+        tk.Label(frame, text="Hide:").pack(side="left")
+        self.exclude_entry = tk.Entry(frame, width=30)
+        self.exclude_entry.pack(side="left", padx=5)
+        self.exclude_entry.bind("<Return>", lambda event: self.apply())
+
+        tk.Button(frame, text="Filter", command=self.apply).pack(side="left")
+        tk.Button(frame, text="Clear", command=self.clear).pack(side="left", padx=5)
+
+        self.status_lbl = tk.Label(frame, text="Regexes, separate rules with ;", fg="gray")
+        self.status_lbl.pack(side="left", padx=5)
+        return frame
+
+    def apply(self):
+        include = split_rules(self.include_entry.get())
+        exclude = split_rules(self.exclude_entry.get())
+        try:
+            for rule in include + exclude:
+                if matches_every_line(rule):
+                    self.status_lbl.config(text=f"❗ Rule matches every line: {rule}", fg="red")
+                    return
+            self.logger.set_filter(self.source, include, exclude)
+        except re.error as e:
+            self.status_lbl.config(text=f"❗ Invalid rule: {e}", fg="red")
+            return
+        if include or exclude:
+            self.status_lbl.config(text="Filtered", fg="orange")
+        else:
+            self.status_lbl.config(text="Regexes, separate rules with ;", fg="gray")
+
+    def clear(self):
+        self.include_entry.delete(0, tk.END)
+        self.exclude_entry.delete(0, tk.END)
+        self.apply()
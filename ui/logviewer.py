@@ -0,0 +1,236 @@
+import datetime
+import glob
+import os
+import sys
+import tkinter as tk
+from tkinter import filedialog, ttk
+from core.logfile import LogFile, parse_time
+
+# Lines rendered when the window is first drawn, until the Text reports its real height
+DEFAULT_ROWS = 40
+# Lines moved by one mouse wheel notch
+WHEEL_LINES = 3
+
+class LogViewerWindow:
+    """Browse archived and current log files of any size.
+
+    The file is memory-mapped by core.logfile.LogFile and the Text widget only
+    ever holds the lines that fit on screen: scrolling re-renders that window
+    from a byte offset instead of loading the file into Tk. The scrollbar
+    maps to byte positions in the file.
+    """
+
+    def __init__(self, root, settings):
+        self.root = root
+        self.settings = settings
+        self.log = None
+        self.top = 0
+        self.window = None
+
+    def log_files(self):
+        # The configured log files, everything next to them, the spilled panes and the capture, newest first
+        directories = {self.settings.SPILL_DIRECTORY, os.path.join(self.settings.SPILL_DIRECTORY, "capture")}
+        for realm in self.settings.REALMS:
+            for path in (realm.WORLD_LOG_FILE, realm.AUTH_LOG_FILE):
+                if path:
+                    directories.add(os.path.dirname(os.path.abspath(path)))
+
+        files = set()
+        for directory in directories:
+            if directory:
+                files.update(glob.glob(os.path.join(directory, "*.log*")))
+        return sorted(files, key=lambda path: os.path.getmtime(path), reverse=True)
+
+    def live_files(self):
+        # Logs the servers write to; mapping one keeps a starting server from truncating it on Windows
+        return {
+            os.path.normcase(os.path.abspath(path))
+            for realm in self.settings.REALMS
+            for path in (realm.WORLD_LOG_FILE, realm.AUTH_LOG_FILE)
+            if path
+        }
+
+    def open_log_viewer_window(self):
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            return
+
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Log Viewer")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Get the correct path to the icon
+        if hasattr(sys, '_MEIPASS'):
+            base_path = sys._MEIPASS
+        else:
+            base_path = os.path.abspath(".")
+
+        icon_path = os.path.join(base_path, "assets", "manager.ico")
+        self.window.iconbitmap(icon_path)
+
+        # File selection
+        file_frame = tk.Frame(self.window)
+        file_frame.pack(fill='x', padx=5, pady=5)
+
+        tk.Label(file_frame, text="File:").pack(side="left")
+        self.file_box = ttk.Combobox(file_frame, values=self.log_files(), width=80)
+        self.file_box.pack(side="left", fill='x', expand=True, padx=5)
+        self.file_box.bind("<<ComboboxSelected>>", lambda event: self.open_file(self.file_box.get()))
+        self.file_box.bind("<Return>", lambda event: self.open_file(self.file_box.get()))
+        tk.Button(file_frame, text="Browse", command=self.browse).pack(side="left", padx=5)
+        tk.Button(file_frame, text="Reload", command=self.reload).pack(side="left")
+
+        # Jump to a time
+        jump_frame = tk.Frame(self.window)
+        jump_frame.pack(fill='x', padx=5)
+
+        tk.Label(jump_frame, text="Go to time:").pack(side="left")
+        self.time_entry = tk.Entry(jump_frame, width=22)
+        self.time_entry.insert(0, f"{datetime.datetime.now():%Y-%m-%d} 00:00:00")
+        self.time_entry.pack(side="left", padx=5)
+        self.time_entry.bind("<Return>", lambda event: self.jump_to_time())
+        tk.Button(jump_frame, text="Go", command=self.jump_to_time).pack(side="left")
+        tk.Button(jump_frame, text="Start", command=lambda: self.show(0)).pack(side="left", padx=(15, 5))
+        tk.Button(jump_frame, text="End", command=self.show_end).pack(side="left")
+
+        self.status_lbl = tk.Label(jump_frame, text="", fg="gray")
+        self.status_lbl.pack(side="right")
+
+        # The visible lines only, scrolling is done by re-rendering
+        text_frame = tk.Frame(self.window)
+        text_frame.pack(fill='both', expand=True, padx=5, pady=5)
+
+        self.scrollbar = tk.Scrollbar(text_frame, command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.text = tk.Text(text_frame, wrap="none", width=140, height=DEFAULT_ROWS, state='disabled')
+        self.text.pack(side="left", fill='both', expand=True)
+        self.text.bind("<MouseWheel>", self.on_wheel)
+        self.text.bind("<Button-4>", lambda event: self.scroll_lines(-WHEEL_LINES))
+        self.text.bind("<Button-5>", lambda event: self.scroll_lines(WHEEL_LINES))
+        self.text.bind("<Prior>", lambda event: self.scroll_lines(-self.rows()))
+        self.text.bind("<Next>", lambda event: self.scroll_lines(self.rows()))
+        self.text.bind("<Configure>", lambda event: self.render())
+
+        # Start on the newest archived or spilled log, a live one is only opened on request
+        live = self.live_files()
+        files = self.file_box.cget("values")
+        for index, path in enumerate(files):
+            if os.path.normcase(os.path.abspath(path)) not in live:
+                self.file_box.current(index)
+                self.open_file(path)
+                break
+
+    def close(self):
+        if self.log:
+            self.log.close()
+            self.log = None
+        self.window.destroy()
+
+    def browse(self):
+        path = filedialog.askopenfilename(parent=self.window)
+        if path:
+            self.file_box.set(path)
+            self.open_file(path)
+
+    def open_file(self, path):
+        if self.log:
+            self.log.close()
+        try:
+            self.log = LogFile(path).open()
+        except OSError as e:
+            self.log = None
+            self.status_lbl.config(text=f"❗ Cannot open {path}: {e}", fg="red")
+            self.set_text("")
+            return
+        self.show_end()
+
+    def reload(self):
+        # The current log keeps growing, map what was written since
+        if not self.log:
+            return
+        at_end = self.top >= self.log.tail(self.rows())
+        try:
+            self.log.reopen()
+        except OSError as e:
+            self.status_lbl.config(text=f"❗ Cannot reopen {self.log.path}: {e}", fg="red")
+            return
+        if at_end:
+            self.show_end()
+        else:
+            self.show(min(self.top, self.log.size))
+
+    def rows(self):
+        height = self.text.winfo_height()
+        if height <= 1:
+            return DEFAULT_ROWS
+        line_height = self.text.tk.call("font", "metrics", self.text.cget("font"), "-linespace")
+        return max(1, height // int(line_height))
+
+    def show(self, offset):
+        if not self.log:
+            return
+        self.top = self.log.line_start(offset)
+        self.render()
+
+    def show_end(self):
+        if self.log:
+            self.show(self.log.tail(self.rows()))
+
+    def render(self):
+        if not self.log:
+            return
+        lines = self.log.lines(self.top, self.rows())
+        self.set_text("\n".join(text for _, text in lines))
+
+        size = self.log.size
+        end = self.log.next_line(lines[-1][0]) if lines else self.top
+        if size:
+            self.scrollbar.set(self.top / size, min(1.0, end / size))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+        stamp = self.log.timestamp(self.top) if lines else None
+        position = f"{stamp:%Y-%m-%d %H:%M:%S}" if stamp else f"byte {self.top:,}"
+        self.status_lbl.config(text=f"{position} of {size / 1024 / 1024:,.1f} MB", fg="gray")
+
+    def set_text(self, text):
+        self.text.config(state='normal')
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", text)
+        self.text.config(state='disabled')
+
+    def scroll_lines(self, count):
+        if self.log and count:
+            self.top = self.log.move(self.top, count)
+            # Never scroll past the last full page
+            self.top = min(self.top, self.log.tail(self.rows()))
+            self.render()
+        return "break"
+
+    def on_wheel(self, event):
+        return self.scroll_lines(-WHEEL_LINES if event.delta > 0 else WHEEL_LINES)
+
+    def on_scroll(self, action, amount, unit=None):
+        if not self.log:
+            return
+        if action == "moveto":
+            # Dragging the scrollbar lands on the line at that byte position
+            offset = int(float(amount) * self.log.size)
+            self.show(min(offset, self.log.tail(self.rows())))
+        elif action == "scroll":
+            count = int(amount)
+            self.scroll_lines(count * self.rows() if unit == "pages" else count)
+
+    def jump_to_time(self):
+        if not self.log:
+            return
+        when = parse_time(self.time_entry.get())
+        if when is None:
+            self.status_lbl.config(text="❗ Use a time like 2024-05-01 12:00:00", fg="red")
+            return
+        offset = self.log.find_time(when)
+        if offset is None:
+            self.status_lbl.config(text="❗ This file has no timestamps", fg="red")
+            return
+        self.show(offset)
@@ -1,13 +1,15 @@
 import tkinter as tk
 import webbrowser
 from ui.info import InfoWindow
+from ui.logviewer import LogViewerWindow
 from ui.settings import SettingsWindow
 
 class Menu:
-    def __init__(self, root):
+    def __init__(self, root, settings):
         self.root = root
         self.infowindow = InfoWindow(self.root)
         self.settingswindow = SettingsWindow(self.root)
+        self.logviewerwindow = LogViewerWindow(self.root, settings)
 
     def create_menu_bar(self, root):
         menu_bar = tk.Menu(root)
@@ -17,6 +19,7 @@ class Menu:
         file_menu = tk.Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Settings", command=self.settingswindow.open_settings_window)
+        file_menu.add_command(label="Log Viewer", command=self.logviewerwindow.open_log_viewer_window)
         file_menu.add_command(label="Exit", command=root.destroy)
 
         # Add a "Help" menu
@@ -0,0 +1,255 @@
+import os
+import sys
+import tkinter as tk
+from tkinter import messagebox, scrolledtext, ttk
+from ui.bootprofile import BootProfileWindow
+from ui.filterbar import FilterBar
+from ui.search import SearchBar
+
+class RealmView:
+    """Status rows, log tabs and console of one realm in the manager window."""
+
+    def __init__(self, root, realm, logger, settings):
+        self.root = root
+        self.realm = realm
+        self.logger = logger
+        self.settings = settings
+
+    def create_controls(self, parent):
+        realm = self.realm
+
+        # Worldserver Buttons
+        worldserver_button_frame = tk.Frame(parent)
+        worldserver_button_frame.pack(pady=5, fill='x')
+
+        self.world_status_lbl = tk.Label(worldserver_button_frame, text=f"{realm.world_label}: Unknown", fg="gray")
+        self.world_status_lbl.pack(side="left", padx=5)
+
+        self.w_start_btn = tk.Button(worldserver_button_frame, text="Start Server", command=realm.start_worldserver, width=15)
+        self.w_stop_btn = tk.Button(worldserver_button_frame, text="Stop Server", command=realm.stop_worldserver, width=15)
+        self.w_kill_btn = tk.Button(worldserver_button_frame, text="Kill Server", command=realm.kill_worldserver, width=15)
+        self.w_restart_btn = tk.Button(worldserver_button_frame, text="Restart Server", command=self.restart_worldserver, width=15)
+        self.boot_profile_window = BootProfileWindow(self.root, realm)
+        self.w_profile_btn = tk.Button(worldserver_button_frame, text="Boot Profile", command=self.boot_profile_window.open_boot_profile_window, width=15)
+
+        self.w_start_btn.pack(side=tk.LEFT, padx=5)
+        self.w_stop_btn.pack(side=tk.LEFT, padx=5)
+        self.w_kill_btn.pack(side=tk.LEFT, padx=5)
+        self.w_restart_btn.pack(side=tk.LEFT, padx=5)
+        self.w_profile_btn.pack(side=tk.LEFT, padx=5)
+
+        # Authserver Buttons, realms can share the authserver of another realm
+        self.auth_status_lbl = None
+        if realm.has_auth:
+            authserver_button_frame = tk.Frame(parent)
+            authserver_button_frame.pack(pady=5, fill='x')
+
+            self.auth_status_lbl = tk.Label(authserver_button_frame, text=f"{realm.auth_label}: Unknown", fg="gray")
+            self.auth_status_lbl.pack(side="left", padx=5)
+
+            self.a_start_btn = tk.Button(authserver_button_frame, text="Start Server", command=realm.start_authserver, width=15)
+            self.a_stop_btn = tk.Button(authserver_button_frame, text="Kill Server", command=realm.kill_authserver, width=15)
+
+            self.a_start_btn.pack(side=tk.LEFT, padx=5)
+            self.a_stop_btn.pack(side=tk.LEFT, padx=5)
+
+        # Server Resources
+        server_resource_frame = tk.Frame(parent)
+        server_resource_frame.pack(pady=5, fill='x')
+
+        self.resource_title_lbl = tk.Label(server_resource_frame, text="Server Resources:", fg="black")
+        self.resource_title_lbl.pack(side="left", padx=5)
+
+        self.resource_lbl = tk.Label(server_resource_frame, text=self.resource_text(None), fg="grey")
+        self.resource_lbl.pack(side='left', padx=5)
+
+        # Server Stats
+        serverstats_button_frame = tk.Frame(parent)
+        serverstats_button_frame.pack(pady=5, fill='x')
+
+        self.serverstats_lbl = tk.Label(serverstats_button_frame, text="Server Stats:", fg="black")
+        self.serverstats_lbl.pack(side="left", padx=5)
+
+        self.serverstats_onlineplayers_lbl = tk.Label(serverstats_button_frame, text="Online Players: Unknown", fg="grey")
+        self.serverstats_onlineplayers_lbl.pack(side="left", padx=5)
+
+        self.serverstats_onlinegms_lbl = tk.Label(serverstats_button_frame, text="Online GMs: Unknown", fg="grey")
+        self.serverstats_onlinegms_lbl.pack(side="left", padx=5)
+
+        self.serverstats_open_tickets_lbl = tk.Label(serverstats_button_frame, text="Open Tickets: Unknown", fg="grey")
+        self.serverstats_open_tickets_lbl.pack(side="left", padx=5)
+
+    def create_tabs(self, notebook):
+        realm = self.realm
+
+        # Authserver log tab
+        if realm.has_auth:
+            self.auth_log_frame = ttk.Frame(notebook)
+            notebook.add(self.auth_log_frame, text=f"{realm.auth_label} Log")
+            self.auth_search = SearchBar(self.root, realm.supervisor, realm.auth_key, realm.auth_label)
+            self.auth_search.create(self.auth_log_frame)
+            self.auth_filter = FilterBar(self.logger, realm.auth_key)
+            self.auth_filter.create(self.auth_log_frame)
+
+            self.auth_log = scrolledtext.ScrolledText(self.auth_log_frame, state='disabled')
+            self.auth_log.pack(fill="both", expand=True)
+            self.logger.add_pane(realm.auth_key, self.auth_log, self.settings.MAX_LINES_AUTH)
+
+        # Worldserver log tab
+        self.world_log_frame = ttk.Frame(notebook)
+        notebook.add(self.world_log_frame, text=f"{realm.world_label} Console")
+
+        # Worldserver log tab Search box
+        self.world_search = SearchBar(self.root, realm.supervisor, realm.world_key, realm.world_label)
+        self.world_search.create(self.world_log_frame)
+
+        # Worldserver log tab Include/exclude filter
+        self.world_filter = FilterBar(self.logger, realm.world_key)
+        self.world_filter.create(self.world_log_frame)
+
+        # Worldserver log tab Frame to hold the text and scrollbar
+        self.world_log_text_frame = tk.Frame(self.world_log_frame)
+        self.world_log_text_frame.pack(fill="both", expand=True, padx=5, pady=(5, 0))
+
+        # Worldserver log tab Scrollbar
+        self.world_scrollbar = tk.Scrollbar(self.world_log_text_frame)
+        self.world_scrollbar.pack(side="right", fill="y")
+
+        # Worldserver log tab World log output (Text widget)
+        self.world_log_output = tk.Text(
+            self.world_log_text_frame,
+            wrap="word",
+            yscrollcommand=self.world_scrollbar.set
+        )
+        self.world_log_output.pack(side="left", fill="both", expand=True)
+
+        # Worldserver log tab Connect scrollbar to text widget
+        self.world_scrollbar.config(command=self.world_log_output.yview)
+        self.logger.add_pane(realm.world_key, self.world_log_output, self.settings.MAX_LINES_WORLD)
+
+        # Worldserver log tab Frame for input + button
+        self.world_input_frame = tk.Frame(self.world_log_frame)
+        self.world_input_frame.pack(fill="x", padx=5, pady=5)
+
+        # Worldserver log tab Input entry
+        self.world_input = tk.Entry(self.world_input_frame)
+        self.world_input.pack(side="left", fill="x", expand=True)
+
+        placeholder = "Type a command here!"
+        self.world_input.insert(0, placeholder)
+        self.world_input.config(fg='grey')
+
+        # Worldserver log tab Define focus-in and focus-out behavior
+        def on_focus_in(event):
+            if self.world_input.get() == placeholder:
+                self.world_input.delete(0, tk.END)
+                self.world_input.config(fg='black')
+
+        def on_focus_out(event):
+            if not self.world_input.get():
+                self.world_input.insert(0, placeholder)
+                self.world_input.config(fg='grey')
+
+        self.world_input.bind("<FocusIn>", on_focus_in)
+        self.world_input.bind("<FocusOut>", on_focus_out)
+
+        # Worldserver log tab Send button
+        self.world_send_button = tk.Button(self.world_input_frame, text="Send", command=self.send_world_input)
+        self.world_send_button.pack(side="left", padx=(5, 0))
+        self.world_input.bind("<Return>", lambda event: self.send_world_input())
+
+    def send_world_input(self):
+        command = self.world_input.get().strip()
+        if command and self.realm.send_world_command(command, prefix="> "):
+            self.world_input.delete(0, 'end')
+
+    def refresh_status(self):
+        realm = self.realm
+        if realm.world_running():
+            # Our own worldserver is only Running once its console is up
+            status, color = ("Starting", "orange") if realm.world_process and not realm.world_ready else ("Running", "green")
+        elif realm.pending_restart:
+            status, color = "Restarting", "orange"
+        elif realm.restart_policy.tripped:
+            status, color = "Crash loop", "red"
+        else:
+            status, color = "Stopped", "red"
+        self.world_status_lbl.config(text=f"{realm.world_label}: {status}", fg=color)
+
+        if self.auth_status_lbl:
+            auth_running = self.realm.auth_running()
+            self.auth_status_lbl.config(
+                text=f"{self.realm.auth_label}: {'Running' if auth_running else 'Stopped'}",
+                fg="green" if auth_running else "red"
+            )
+
+    def resource_text(self, usage):
+        zero = {"cpu": 0.0, "mem": 0.0}
+        world = (usage or {}).get(self.realm.world_key, zero)
+        text = f"Worldserver: CPU {world['cpu']:.1f}% | RAM {world['mem']:.1f} MB"
+        if self.realm.has_auth:
+            auth = (usage or {}).get(self.realm.auth_key, zero)
+            text += f"   Authserver: CPU {auth['cpu']:.1f}% | RAM {auth['mem']:.1f} MB"
+        return text
+
+    def render_resources(self, usage):
+        self.resource_lbl.config(text=self.resource_text(usage), fg='black')
+
+    def render_stats(self, snapshot):
+        if snapshot is None:
+            self.serverstats_onlineplayers_lbl.config(text="Online Players: 0", fg="grey")
+            self.serverstats_onlinegms_lbl.config(text="Online GMs: 0", fg="grey")
+            self.serverstats_open_tickets_lbl.config(text="Open Tickets: 0", fg="grey")
+            return
+
+        self.serverstats_onlineplayers_lbl.config(text=f"Online Players: {snapshot.online}", fg="black")
+        self.serverstats_onlinegms_lbl.config(text=f"Online GMs: {snapshot.gms}", fg="black")
+        self.serverstats_open_tickets_lbl.config(text=f"Open Tickets: {snapshot.tickets}", fg="black")
+
+    def restart_worldserver(self):
+        world_running = self.realm.world_running()
+
+        # Create popup window
+        restart_popup = tk.Toplevel(self.root)
+        restart_popup.title(f"Restart {self.realm.world_label}")
+
+        # Get the correct path to the icon
+        if hasattr(sys, '_MEIPASS'):
+            base_path = sys._MEIPASS
+        else:
+            base_path = os.path.abspath(".")
+
+        icon_path = os.path.join(base_path, "assets", "manager.ico")
+        restart_popup.iconbitmap(icon_path)
+
+        if not world_running:
+            tk.Label(restart_popup, text=f"❗ ERROR: {self.realm.world_label} is offline.", fg="red", font=("Arial", 8)).grid(row=0, column=0, columnspan=2)
+        else:
+            tk.Label(restart_popup, text="Delay:").grid(row=0, column=0, padx=5, pady=5)
+            delay_entry = tk.Entry(restart_popup)
+            delay_entry.grid(row=0, column=1, padx=5, pady=5)
+            tk.Label(restart_popup, text="#delay: use a timestring like \"1h15m30s\".", fg="gray", font=("Arial", 8)).grid(row=1, column=0, columnspan=2)
+
+            tk.Label(restart_popup, text="Exit Code:").grid(row=2, column=0, padx=5, pady=5)
+            exitcode_entry = tk.Entry(restart_popup)
+            exitcode_entry.grid(row=2, column=1, padx=5, pady=5)
+            exitcode_entry.insert(0, "2")
+            tk.Label(restart_popup, text="If you use custom exitcodes you can change it.\n0 = Shutdown\n1 = Crash/Error\n2 = Restart", fg="gray", font=("Arial", 8)).grid(row=3, column=0, columnspan=2)
+
+            self.delay_str = ""
+            def submit():
+                delay = delay_entry.get()
+                exit_code = exitcode_entry.get()
+                if delay and exit_code:
+                    self.realm.send_world_command(f"server restart {delay} {exit_code}")
+                    self.delay_str = delay
+                    restart_popup.destroy()
+                else:
+                    messagebox.showwarning("Input error", "Please fill both fields")
+
+            submit_btn = tk.Button(restart_popup, text="Submit", command=submit)
+            submit_btn.grid(row=4, column=0, columnspan=2, pady=10)
+
+            restart_popup.grab_set()
+            self.root.wait_window(restart_popup)
+            self.logger.manager(f"🔴 {self.realm.world_label} will restart in {self.delay_str}...\n")
@@ -0,0 +1,107 @@
+import os
+import sys
+import tkinter as tk
+
+# Seconds a search may take before it is reported as failed
+SEARCH_TIMEOUT = 10
+
+class SearchBar:
+    """Search box of a log tab, hits come from the supervisor's LogIndex.
+
+    The search runs on the supervisor's executor and the hits are shown with
+    the lines around them in a separate window, newest first.
+    """
+
+    def __init__(self, root, supervisor, source, label):
+        self.root = root
+        self.supervisor = supervisor
+        self.source = source
+        self.label = label
+        self.results_window = None
+
+    def create(self, parent):
+        frame = tk.Frame(parent)
+        frame.pack(fill="x", padx=5, pady=(5, 0))
+
+        tk.Label(frame, text="Search:").pack(side="left")
+        self.entry = tk.Entry(frame)
+        self.entry.pack(side="left", fill="x", expand=True, padx=5)
+        self.entry.bind("<Return>", lambda event: self.search())
+
+        self.all_sources = tk.BooleanVar(value=False)
+        tk.Checkbutton(frame, text="All logs", variable=self.all_sources).pack(side="left")
+        self.search_btn = tk.Button(frame, text="Search", command=self.search)
+        self.search_btn.pack(side="left", padx=(5, 0))
+
+        if self.supervisor.search is None:
+            self.entry.insert(0, "Log indexing is off (index_logs in settings.ini)")
+            for widget in (self.entry, self.search_btn):
+                widget.config(state="disabled")
+        return frame
+
+    def search(self):
+        text = self.entry.get().strip()
+        if not text:
+            return
+        sources = None if self.all_sources.get() else [self.source]
+        self.search_btn.config(state="disabled")
+        self.supervisor.executor.submit(
+            lambda: self.supervisor.search.search(text, sources),
+            callback=lambda hits: self.show_results(text, hits),
+            errback=self.on_search_failed,
+            timeout=SEARCH_TIMEOUT,
+        )
+
+    def on_search_failed(self, err):
+        self.search_btn.config(state="normal")
+        self.supervisor.log.manager(f"❗ Log search failed: {err}\n")
+
+    def show_results(self, text, hits):
+        self.search_btn.config(state="normal")
+        if self.results_window is None or not self.results_window.winfo_exists():
+            self.open_results_window()
+
+        self.results_window.title(f"Search {self.label} - {text}")
+        scope = "all logs" if self.all_sources.get() else self.label
+        self.results_lbl.config(text=f"{len(hits)} hits for '{text}' in {scope}, newest first.")
+
+        output = self.results_text
+        output.config(state="normal")
+        output.delete("1.0", tk.END)
+        for hit in hits:
+            output.insert(tk.END, f"{hit.source}  {os.path.basename(hit.path)}\n", "header")
+            for line in hit.before:
+                output.insert(tk.END, f"  {line}\n", "context")
+            output.insert(tk.END, f"> {hit.line}\n", "hit")
+            for line in hit.after:
+                output.insert(tk.END, f"  {line}\n", "context")
+            output.insert(tk.END, "\n")
+        output.config(state="disabled")
+        output.see("1.0")
+
+    def open_results_window(self):
+        self.results_window = tk.Toplevel(self.root)
+
+        # Get the correct path to the icon
+        if hasattr(sys, '_MEIPASS'):
+            base_path = sys._MEIPASS
+        else:
+            base_path = os.path.abspath(".")
+
+        icon_path = os.path.join(base_path, "assets", "manager.ico")
+        self.results_window.iconbitmap(icon_path)
+
+        self.results_lbl = tk.Label(self.results_window, text="", anchor="w")
+        self.results_lbl.pack(fill="x", padx=5, pady=5)
+
+        frame = tk.Frame(self.results_window)
+        frame.pack(fill="both", expand=True, padx=5, pady=(0, 5))
+        scrollbar = tk.Scrollbar(frame)
+        scrollbar.pack(side="right", fill="y")
+        self.results_text = tk.Text(frame, wrap="none", width=140, height=35, yscrollcommand=scrollbar.set, state="disabled")
+        self.results_text.pack(side="left", fill="both", expand=True)
+        scrollbar.config(command=self.results_text.yview)
+
+        self.results_text.tag_configure("header", foreground="gray")
+        self.results_text.tag_configure("context", foreground="#555555")
+        self.results_text.tag_configure("hit", background="#fff3b0")
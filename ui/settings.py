@@ -31,6 +31,12 @@ class SettingsWindow:
                 entry.delete(0, tk.END)
                 entry.insert(0, file_path)
 
+        def browse_directory(entry):
+            directory = filedialog.askdirectory()
+            if directory:
+                entry.delete(0, tk.END)
+                entry.insert(0, directory)
+
         tk.Label(settings_win, text="Worldserver.exe path:", anchor="w", justify="left").grid(row=0, column=0, padx=5, pady=5, sticky="w")
         world_entry = tk.Entry(settings_win, width=50)
         world_entry.insert(0, s.get('Paths', 'worldserver'))
@@ -95,12 +101,92 @@ class SettingsWindow:
         database_auth.insert(0, s.get('Database', 'database_auth'))
         database_auth.grid(row=11, column=1, padx=5, pady=5)
 
+        tk.Label(settings_win, text="Manager Log max lines:", anchor="w", justify="left").grid(row=12, column=0, padx=5, pady=5, sticky="w")
+        max_lines_manager = tk.Entry(settings_win, width=50)
+        max_lines_manager.insert(0, s.get('Logging', 'max_lines_manager', fallback='5000'))
+        max_lines_manager.grid(row=12, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Authserver Log max lines:", anchor="w", justify="left").grid(row=13, column=0, padx=5, pady=5, sticky="w")
+        max_lines_auth = tk.Entry(settings_win, width=50)
+        max_lines_auth.insert(0, s.get('Logging', 'max_lines_auth', fallback='10000'))
+        max_lines_auth.grid(row=13, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Worldserver Console max lines:", anchor="w", justify="left").grid(row=14, column=0, padx=5, pady=5, sticky="w")
+        max_lines_world = tk.Entry(settings_win, width=50)
+        max_lines_world.insert(0, s.get('Logging', 'max_lines_world', fallback='20000'))
+        max_lines_world.grid(row=14, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Log spill directory:", anchor="w", justify="left").grid(row=15, column=0, padx=5, pady=5, sticky="w")
+        spill_directory = tk.Entry(settings_win, width=50)
+        spill_directory.insert(0, s.get('Logging', 'spill_directory', fallback='logs'))
+        spill_directory.grid(row=15, column=1, padx=5, pady=5)
+        tk.Button(settings_win, text="Browse", command=lambda: browse_directory(spill_directory)).grid(row=15, column=2, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Database Pool Size:", anchor="w", justify="left").grid(row=16, column=0, padx=5, pady=5, sticky="w")
+        database_pool_size = tk.Entry(settings_win, width=50)
+        database_pool_size.insert(0, s.get('Database', 'database_pool_size', fallback='4'))
+        database_pool_size.grid(row=16, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Stats refresh interval (s):", anchor="w", justify="left").grid(row=17, column=0, padx=5, pady=5, sticky="w")
+        stats_interval = tk.Entry(settings_win, width=50)
+        stats_interval.insert(0, s.get('General', 'stats_interval', fallback='10'))
+        stats_interval.grid(row=17, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Database query timeout (s):", anchor="w", justify="left").grid(row=18, column=0, padx=5, pady=5, sticky="w")
+        database_timeout = tk.Entry(settings_win, width=50)
+        database_timeout.insert(0, s.get('Database', 'database_timeout', fallback='5'))
+        database_timeout.grid(row=18, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Resource sample interval (s):", anchor="w", justify="left").grid(row=19, column=0, padx=5, pady=5, sticky="w")
+        resource_interval = tk.Entry(settings_win, width=50)
+        resource_interval.insert(0, s.get('General', 'resource_interval', fallback='3'))
+        resource_interval.grid(row=19, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Metrics history file:", anchor="w", justify="left").grid(row=20, column=0, padx=5, pady=5, sticky="w")
+        metrics_file = tk.Entry(settings_win, width=50)
+        metrics_file.insert(0, s.get('Metrics', 'metrics_file', fallback='metrics.bin'))
+        metrics_file.grid(row=20, column=1, padx=5, pady=5)
+        tk.Button(settings_win, text="Browse", command=lambda: browse(metrics_file)).grid(row=20, column=2, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Bulk import commands/s:", anchor="w", justify="left").grid(row=21, column=0, padx=5, pady=5, sticky="w")
+        account_command_rate = tk.Entry(settings_win, width=50)
+        account_command_rate.insert(0, s.get('Accounts', 'command_rate', fallback='20'))
+        account_command_rate.grid(row=21, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Bulk import batch size:", anchor="w", justify="left").grid(row=22, column=0, padx=5, pady=5, sticky="w")
+        account_batch_size = tk.Entry(settings_win, width=50)
+        account_batch_size.insert(0, s.get('Accounts', 'batch_size', fallback='5'))
+        account_batch_size.grid(row=22, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Control API port (0 = off):", anchor="w", justify="left").grid(row=23, column=0, padx=5, pady=5, sticky="w")
+        api_port = tk.Entry(settings_win, width=50)
+        api_port.insert(0, s.get('API', 'port', fallback='0'))
+        api_port.grid(row=23, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Control API token:", anchor="w", justify="left").grid(row=24, column=0, padx=5, pady=5, sticky="w")
+        api_token = tk.Entry(settings_win, width=50, show="*")
+        api_token.insert(0, s.get('API', 'token', fallback=''))
+        api_token.grid(row=24, column=1, padx=5, pady=5)
+
+        tk.Label(settings_win, text="Prometheus port (0 = off):", anchor="w", justify="left").grid(row=25, column=0, padx=5, pady=5, sticky="w")
+        metrics_port = tk.Entry(settings_win, width=50)
+        metrics_port.insert(0, s.get('Metrics', 'port', fallback='0'))
+        metrics_port.grid(row=25, column=1, padx=5, pady=5)
+
         def save():
             s.WORLD_PATH = world_entry.get()
             s.AUTH_PATH = auth_entry.get()
             s.WORLD_LOG_FILE = world_log_entry.get()
             s.AUTH_LOG_FILE = auth_log_entry.get()
             s.RESTART_WORLDSERVER_ON_CRASH = restart_var.get()
+            s.STATS_INTERVAL = stats_interval.get()
+            s.RESTART_INITIAL_DELAY = s.get('Restart', 'initial_delay', fallback='5')
+            s.RESTART_MAX_DELAY = s.get('Restart', 'max_delay', fallback='300')
+            s.RESTART_MULTIPLIER = s.get('Restart', 'multiplier', fallback='2')
+            s.RESTART_MAX_COUNT = s.get('Restart', 'max_restarts', fallback='5')
+            s.RESTART_WINDOW = s.get('Restart', 'window', fallback='600')
+            s.RESTART_STABLE_AFTER = s.get('Restart', 'stable_after', fallback='300')
+            s.RESOURCE_INTERVAL = resource_interval.get()
             s.DATABASE_HOST = database_host.get()
             s.DATABASE_PORT = database_port.get()
             s.DATABASE_USER = database_user.get()
@@ -108,8 +194,25 @@ class SettingsWindow:
             s.DATABASE_WORLD = database_world.get()
             s.DATABASE_CHARACTERS = database_characters.get()
             s.DATABASE_AUTH = database_auth.get()
+            s.DATABASE_POOL_SIZE = database_pool_size.get()
+            s.DATABASE_TIMEOUT = database_timeout.get()
+            s.MAX_LINES_MANAGER = max_lines_manager.get()
+            s.MAX_LINES_AUTH = max_lines_auth.get()
+            s.MAX_LINES_WORLD = max_lines_world.get()
+            s.SPILL_DIRECTORY = spill_directory.get()
+            s.INDEX_LOGS = s.getboolean('Logging', 'index_logs', fallback=True)
+            s.LOG_LINE_RATE = s.get('Logging', 'line_rate', fallback='2000')
+            s.METRICS_FILE = metrics_file.get()
+            s.METRICS_HOST = s.get('Metrics', 'host', fallback='127.0.0.1')
+            s.METRICS_PORT = metrics_port.get()
+            s.ACCOUNT_COMMAND_RATE = account_command_rate.get()
+            s.ACCOUNT_BATCH_SIZE = account_batch_size.get()
+            s.API_HOST = s.get('API', 'host', fallback='127.0.0.1')
+            s.API_PORT = api_port.get()
+            s.API_SOCKET = s.get('API', 'socket', fallback='')
+            s.API_TOKEN = api_token.get()
             s.save_settings()
             settings_win.destroy()
             self.logger.manager("🔴 Settings saved.\n")
 
-        tk.Button(settings_win, text="Save", command=save).grid(row=12, column=1, pady=10)
+        tk.Button(settings_win, text="Save", command=save).grid(row=26, column=1, pady=10)
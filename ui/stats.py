@@ -0,0 +1,148 @@
+import datetime
+import time
+import tkinter as tk
+from tkinter import ttk
+
+# History range -> (metrics tier, seconds shown)
+HISTORY_RANGES = {
+    "Last hour": ("raw", 3600),
+    "Last day": ("minute", 24 * 3600),
+    "Last 90 days": ("hour", 90 * 24 * 3600),
+}
+
+PIE_LABELS = ['Alliance', 'Horde']
+PIE_COLORS = ['#0070ff', '#c41f3b']
+
+class StatsTab:
+    """Server Stats tab, its figure and canvas are built once and updated in place.
+
+    Nothing is drawn while the tab is hidden, and the canvas is only redrawn
+    when the faction counts or the history data actually changed. matplotlib
+    is imported when the tab is first shown.
+    """
+
+    def __init__(self, notebook, supervisor):
+        self.notebook = notebook
+        self.supervisor = supervisor
+        self.realms = supervisor.realms
+
+        self.frame = ttk.Frame(notebook)
+        notebook.add(self.frame, text="Server Stats")
+
+        history_controls = tk.Frame(self.frame)
+        history_controls.pack(fill='x', padx=5)
+
+        tk.Label(history_controls, text="History:").pack(side="left")
+        self.history_range = ttk.Combobox(history_controls, values=list(HISTORY_RANGES), state="readonly", width=15)
+        self.history_range.current(0)
+        self.history_range.pack(side="left", padx=5)
+        self.history_range.bind("<<ComboboxSelected>>", lambda event: self.refresh())
+
+        self.figure = None
+        self._pie_counts = {}
+        self._history_key = None
+
+    def build(self):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        # A plain Figure, pyplot would keep a reference to every figure ever made
+        self.figure = Figure(figsize=(7, 7))
+        grid = self.figure.add_gridspec(4, len(self.realms), height_ratios=[2, 1, 1, 1])
+        self.pie_axes = {realm.id: self.figure.add_subplot(grid[0, i]) for i, realm in enumerate(self.realms)}
+        self.cpu_ax = self.figure.add_subplot(grid[1, :])
+        self.mem_ax = self.figure.add_subplot(grid[2, :], sharex=self.cpu_ax)
+        self.players_ax = self.figure.add_subplot(grid[3, :], sharex=self.cpu_ax)
+        self.create_history_lines()
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.frame)
+        self.canvas.get_tk_widget().pack(expand=True, fill='both')
+
+    def create_history_lines(self):
+        # series name -> Line2D, only their data changes afterwards
+        self.lines = {}
+        many = len(self.realms) > 1
+
+        def add(ax, name, label):
+            self.lines[name], = ax.plot([], [], label=label, linewidth=1)
+
+        for realm in self.realms:
+            add(self.cpu_ax, f"{realm.world_key}.cpu", realm.world_label)
+            add(self.mem_ax, f"{realm.world_key}.mem", realm.world_label)
+            if realm.has_auth:
+                add(self.cpu_ax, f"{realm.auth_key}.cpu", realm.auth_label)
+                add(self.mem_ax, f"{realm.auth_key}.mem", realm.auth_label)
+            prefix = f"{realm.name} " if many else ""
+            add(self.players_ax, f"{realm.id}.online", f"{prefix}Players")
+            add(self.players_ax, f"{realm.id}.gms", f"{prefix}GMs")
+            add(self.players_ax, f"{realm.id}.tickets", f"{prefix}Tickets")
+
+        for ax, title in ((self.cpu_ax, "CPU %"), (self.mem_ax, "RAM MB"), (self.players_ax, "Online")):
+            ax.xaxis_date()
+            ax.set_ylabel(title, fontsize=8)
+            ax.tick_params(labelsize=7)
+            ax.legend(fontsize=7, loc="upper left")
+        self.figure.autofmt_xdate()
+
+    def visible(self):
+        return self.notebook.select() == str(self.frame)
+
+    def refresh(self):
+        if not self.visible():
+            return
+        if self.figure is None:
+            self.build()
+        pies_changed = self.update_pies()
+        history_changed = self.update_history()
+        if pies_changed or history_changed:
+            self.canvas.draw_idle()
+
+    def update_pies(self):
+        changed = False
+        many = len(self.realms) > 1
+        for realm in self.realms:
+            snapshot = self.supervisor.stats.snapshot(realm.id)
+            counts = (snapshot.alliance, snapshot.horde) if snapshot else (0, 0)
+            if self._pie_counts.get(realm.id) == counts:
+                continue
+            self._pie_counts[realm.id] = counts
+            changed = True
+
+            title = "Faction Distribution (Online Players)"
+            if many:
+                title = f"{realm.name}\nFaction Distribution"
+
+            ax = self.pie_axes[realm.id]
+            ax.clear()
+            ax.set_title(title, fontsize=10, pad=3, fontweight='bold')
+            if sum(counts) == 0:
+                ax.axis('off')
+                continue
+
+            def autopct_format(pct, all_vals=counts):
+                absolute = int(round(pct/100.*sum(all_vals)))
+                return f"{pct:.0f}%\n({absolute})"
+
+            ax.pie(counts, labels=PIE_LABELS, autopct=autopct_format, colors=PIE_COLORS, startangle=90)
+            ax.axis('equal')
+        return changed
+
+    def update_history(self):
+        selected = self.history_range.get()
+        tier, seconds = HISTORY_RANGES[selected]
+        since = time.time() - seconds
+
+        data = {name: self.supervisor.metrics.history(name, tier, since) for name in self.lines}
+
+        # Same range, same number of points and same newest point: nothing to redraw
+        key = (selected,) + tuple((len(times), times[-1] if times else None) for times, _ in data.values())
+        if key == self._history_key:
+            return False
+        self._history_key = key
+
+        for name, (times, values) in data.items():
+            self.lines[name].set_data([datetime.datetime.fromtimestamp(t) for t in times], values)
+        for ax in (self.cpu_ax, self.mem_ax, self.players_ax):
+            ax.relim()
+            ax.autoscale_view()
+        return True